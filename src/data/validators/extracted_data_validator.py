@@ -42,16 +42,20 @@ class ExtractedDataValidator(BaseValidator):
     def __init__(
         self,
         expected_fields: Optional[List[str]] = None,
-        strict_mode: bool = True
+        strict_mode: bool = True,
+        short_circuit: bool = False
     ) -> None:
         """Initialize the extracted data validator.
         
         Args:
             expected_fields: List of fields expected in the data (default: ["Total", "Work Order Number"])
             strict_mode: Whether to use strict validation (default: True)
+            short_circuit: Stop at the first failed check instead of collecting
+                every error (default: False)
         """
         super().__init__(strict_mode=strict_mode)
         self.expected_fields = expected_fields or ["Total", "Work Order Number"]
+        self.short_circuit = short_circuit
         
         # Set up field-specific validators
         self.field_validators = {
@@ -133,6 +137,9 @@ class ExtractedDataValidator(BaseValidator):
             
         # Validate each field using field-specific validators
         for field, value in normalized_data.items():
+            if self.short_circuit and self.has_errors():
+                break
+                
             if field in self.field_validators:
                 validator = self.field_validators[field]
                 is_valid, error_msg, _ = validator(value)
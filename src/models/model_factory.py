@@ -63,7 +63,11 @@ class ModelFactory:
     # Registry of available model implementations
     MODEL_REGISTRY: Dict[str, Type[BaseModel]] = {}
 
-    def __init__(self, config_manager: BaseConfigManager):
+    def __init__(
+        self,
+        config_manager: BaseConfigManager,
+        registry: Optional[Dict[str, Type[BaseModel]]] = None
+    ):
         """
         Initialize the factory with required dependencies.
 
@@ -74,6 +78,8 @@ class ModelFactory:
         Args:
             config_manager: Configuration manager instance that provides access to
                           model configurations. Must not be None.
+            registry: Model implementations available to this factory, keyed by
+                    model type (default: the shared MODEL_REGISTRY).
         
         Raises:
             ValueError: If config_manager is None, as it is a required dependency.
@@ -86,6 +92,7 @@ class ModelFactory:
         if config_manager is None:
             raise ValueError("config_manager is required")
         self._config_manager = config_manager
+        self._registry = self.MODEL_REGISTRY if registry is None else registry
         self._retry_config = RetryConfig(
             max_attempts=2,
             delay_seconds=1.0,
@@ -151,8 +158,8 @@ class ModelFactory:
                         parameter="type"
                     )
                     
-                if model_type not in self.MODEL_REGISTRY:
-                    available_types = ", ".join(self.MODEL_REGISTRY.keys())
+                if model_type not in self._registry:
+                    available_types = ", ".join(self._registry.keys())
                     raise ModelCreationError(
                         f"Unsupported model type. Available types: {available_types}",
                         model_name=model_name,
@@ -166,7 +173,7 @@ class ModelFactory:
 
             # Create model instance
             try:
-                model_class = self.MODEL_REGISTRY[model_type]
+                model_class = self._registry[model_type]
                 model = model_class()
                 logger.debug(f"Created instance of {model_class.__name__}")
                 
@@ -6,9 +6,12 @@ Each implementation must provide specific prompt generation strategies while
 adhering to the common interface.
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional, List
 
+from .prompt_cache import PROMPT_CACHE_SIZE, CacheKey, make_cache_key
 from .prompt_config import PromptConfig, PromptTemplate
 
 
@@ -34,6 +37,56 @@ class BasePromptGenerator(ABC):
     - Document any specific requirements
     """
     
+    # Only the render cache lives here, so subclasses declaring __slots__ stay dict-free
+    __slots__ = ("_prompt_cache", "_prompt_cache_lock")
+    
+    def __init__(self) -> None:
+        """
+        Set up the per-instance cache of rendered prompts.
+        
+        The cache is bounded, holds only keys and prompt strings, and is
+        released together with the generator. Subclasses that render
+        through _generate_cached must call this from their own __init__.
+        """
+        self._prompt_cache: "OrderedDict[CacheKey, str]" = OrderedDict()
+        self._prompt_cache_lock = threading.Lock()
+        
+    def _generate_cached(
+        self,
+        data: Dict[str, Any],
+        render: Callable[[Dict[str, Any]], str]
+    ) -> str:
+        """
+        Render a prompt, memoizing the result for data made only of scalars.
+        
+        The caller's data is always what gets rendered; the cache only
+        stores the result. Data that cannot form a cache key (e.g. lists
+        for template loops) is rendered every time.
+        
+        Args:
+            data: Dictionary of values passed to generate_prompt
+            render: Function rendering the prompt from data
+            
+        Returns:
+            str: The rendered prompt
+        """
+        key = make_cache_key(data)
+        if key is None:
+            return render(data)
+            
+        with self._prompt_cache_lock:
+            prompt = self._prompt_cache.get(key)
+            if prompt is not None:
+                self._prompt_cache.move_to_end(key)
+                return prompt
+                
+        prompt = render(data)
+        with self._prompt_cache_lock:
+            self._prompt_cache[key] = prompt
+            if len(self._prompt_cache) > PROMPT_CACHE_SIZE:
+                self._prompt_cache.popitem(last=False)
+        return prompt
+        
     @abstractmethod
     def initialize(self, config: PromptConfig) -> None:
         """
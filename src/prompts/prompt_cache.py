@@ -0,0 +1,41 @@
+"""
+Caching helpers for prompt generators.
+
+Evaluation sweeps render the same prompt for many invoices whose field
+values repeat. These helpers build hashable keys from prompt data so that
+generators can memoize rendered prompts at the generate_prompt boundary.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+# Maximum number of rendered prompts kept per cached render method
+PROMPT_CACHE_SIZE = 512
+
+# Value types that can safely be part of a cache key
+_CACHEABLE_TYPES = (str, int, float, bool)
+
+CacheKey = Tuple[Tuple[str, type, Any], ...]
+
+
+def make_cache_key(data: Dict[str, Any]) -> Optional[CacheKey]:
+    """
+    Build a cache key from prompt data.
+
+    The value type is part of each entry so that values which compare
+    equal but render differently (e.g. 1 and True) do not share a key.
+
+    Args:
+        data: Dictionary of values passed to generate_prompt
+
+    Returns:
+        Optional[CacheKey]: Sorted key tuple, or None if data is a dict
+            subclass (e.g. a defaultdict, whose missing-key handling a
+            plain key cannot carry), any key is not a string, or any value
+            is not a plain scalar
+    """
+    if type(data) is not dict:
+        return None
+    for k, v in data.items():
+        if not isinstance(k, str) or not isinstance(v, _CACHEABLE_TYPES):
+            return None
+    return tuple(sorted((k, type(v), v) for k, v in data.items()))
+
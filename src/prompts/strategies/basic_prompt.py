@@ -11,6 +11,8 @@ class BasicPromptGenerator(BasePromptGenerator):
     A basic prompt generator that uses simple string formatting with provided data.
     """
     
+    __slots__ = ("config", "field", "template")
+    
     def __init__(self, config, field: str):
         """
         Initialize the basic prompt generator.
@@ -37,7 +39,7 @@ class BasicPromptGenerator(BasePromptGenerator):
             str: The formatted prompt
         """
         try:
-            return self.template.format(**data)
+            return self.template.format_map(data)
         except KeyError as e:
             raise ValueError(f"Missing required data field: {e}")
         except Exception as e:
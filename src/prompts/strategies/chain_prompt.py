@@ -1,7 +1,7 @@
 """
 Chain prompt generator that combines multiple prompts.
 """
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from src.prompts.base_prompt_generator import BasePromptGenerator
 
@@ -12,6 +12,8 @@ class ChainPromptGenerator(BasePromptGenerator):
     Each generator in the chain adds its output to a combined prompt.
     """
     
+    __slots__ = ("config", "field", "chain_config", "_specs", "_generators", "_single")
+    
     def __init__(self, config, field: str):
         """
         Initialize the chain prompt generator.
@@ -27,7 +29,10 @@ class ChainPromptGenerator(BasePromptGenerator):
         if not self.chain_config or not isinstance(self.chain_config, list):
             raise ValueError(f"Chain configuration for field '{field}' not found or is not a list")
         
-        self.generators: List[BasePromptGenerator] = []
+        # Child generators are resolved now but only constructed on first use
+        self._specs: List[Tuple[Type[BasePromptGenerator], str]] = []
+        self._generators: Optional[List[BasePromptGenerator]] = None
+        self._single = None
         for generator_config in self.chain_config:
             if not isinstance(generator_config, dict):
                 raise ValueError(f"Invalid generator configuration: {generator_config}")
@@ -42,9 +47,27 @@ class ChainPromptGenerator(BasePromptGenerator):
             try:
                 generator_module = __import__(f"src.prompts.strategies.{generator_type}", fromlist=[""])
                 generator_class = getattr(generator_module, f"{generator_type.capitalize()}PromptGenerator")
-                self.generators.append(generator_class(self.config, generator_field))
             except (ImportError, AttributeError) as e:
                 raise ValueError(f"Failed to import generator type '{generator_type}': {e}")
+            self._specs.append((generator_class, generator_field))
+    
+    @property
+    def generators(self) -> List[BasePromptGenerator]:
+        """Child generators in chain order, constructed on first access."""
+        if self._generators is None:
+            self._build_generators()
+        return self._generators
+    
+    def _build_generators(self) -> None:
+        """Construct the child generators from their resolved classes."""
+        self._generators = [
+            generator_class(self.config, generator_field)
+            for generator_class, generator_field in self._specs
+        ]
+        
+        # A chain of one is just its child, so call the child directly
+        if len(self._generators) == 1:
+            self._single = self._generators[0].generate_prompt
     
     def generate_prompt(self, data: Dict[str, Any]) -> str:
         """
@@ -56,14 +79,13 @@ class ChainPromptGenerator(BasePromptGenerator):
         Returns:
             str: The combined prompt from all generators in the chain
         """
-        if not self.generators:
-            return ""
-        
-        result = []
-        for generator in self.generators:
-            try:
-                result.append(generator.generate_prompt(data))
-            except Exception as e:
-                raise ValueError(f"Error in chain prompt generation: {e}")
+        if self._generators is None:
+            self._build_generators()
         
-        return "\n\n".join(result) 
\ No newline at end of file
+        try:
+            if self._single is not None:
+                return self._single(data)
+            return "\n\n".join(generator.generate_prompt(data) for generator in self._generators)
+        except Exception as e:
+            raise ValueError(f"Error in chain prompt generation: {e}") from e
+ 
\ No newline at end of file
@@ -5,6 +5,15 @@ from typing import Any, Dict, List
 
 from src.prompts.base_prompt_generator import BasePromptGenerator
 
+# Section headers shared by all instances
+_CONTEXT_HDR = "Context:\n"
+_INSTR_HDR = "Instructions:\n"
+_EXAMPLES_HDR = "Examples:\n"
+_REQUIREMENTS_HDR = "Requirements:\n"
+
+# Sections rendered in fixed order ahead of any custom sections
+_STANDARD_SECTIONS = frozenset({"context", "instructions", "examples", "requirements"})
+
 
 class DetailedPromptGenerator(BasePromptGenerator):
     """
@@ -12,6 +21,8 @@ class DetailedPromptGenerator(BasePromptGenerator):
     context, instructions, examples, and specific requirements.
     """
     
+    __slots__ = ("config", "field", "sections")
+    
     def __init__(self, config, field: str):
         """
         Initialize the detailed prompt generator.
@@ -20,6 +31,7 @@ class DetailedPromptGenerator(BasePromptGenerator):
             config: Configuration containing prompt templates and sections
             field: The specific field/key in config that contains this prompt's template
         """
+        super().__init__()
         self.config = config
         self.field = field
         self.sections = self.config.get_sections(field)
@@ -47,6 +59,21 @@ class DetailedPromptGenerator(BasePromptGenerator):
         """
         Generate a structured prompt from all sections in the configuration.
         
+        Prompts for data made only of scalar values are memoized, since the
+        same field values recur across invoices in an evaluation sweep.
+        
+        Args:
+            data: Dictionary containing values to be inserted into each section
+            
+        Returns:
+            str: The formatted detailed prompt
+        """
+        return self._generate_cached(data, self._render)
+    
+    def _render(self, data: Dict[str, Any]) -> str:
+        """
+        Render all sections with the provided data.
+        
         Args:
             data: Dictionary containing values to be inserted into each section
             
@@ -58,28 +85,28 @@ class DetailedPromptGenerator(BasePromptGenerator):
             
             # Add context section
             if "context" in self.sections:
-                context = self.sections["context"].format(**data)
-                prompt_parts.append(f"Context:\n{context}\n")
+                context = self.sections["context"].format_map(data)
+                prompt_parts.append(_CONTEXT_HDR + context + "\n")
             
             # Add instructions section
             if "instructions" in self.sections:
-                instructions = self.sections["instructions"].format(**data)
-                prompt_parts.append(f"Instructions:\n{instructions}\n")
+                instructions = self.sections["instructions"].format_map(data)
+                prompt_parts.append(_INSTR_HDR + instructions + "\n")
             
             # Add examples section if available
             if "examples" in self.sections:
-                examples = self.sections["examples"].format(**data)
-                prompt_parts.append(f"Examples:\n{examples}\n")
+                examples = self.sections["examples"].format_map(data)
+                prompt_parts.append(_EXAMPLES_HDR + examples + "\n")
             
             # Add requirements section if available
             if "requirements" in self.sections:
-                requirements = self.sections["requirements"].format(**data)
-                prompt_parts.append(f"Requirements:\n{requirements}\n")
+                requirements = self.sections["requirements"].format_map(data)
+                prompt_parts.append(_REQUIREMENTS_HDR + requirements + "\n")
             
             # Add custom sections
             for section_name, section_content in self.sections.items():
-                if section_name not in ["context", "instructions", "examples", "requirements"]:
-                    formatted_content = section_content.format(**data)
+                if section_name not in _STANDARD_SECTIONS:
+                    formatted_content = section_content.format_map(data)
                     prompt_parts.append(f"{section_name.capitalize()}:\n{formatted_content}\n")
             
             # Combine all sections
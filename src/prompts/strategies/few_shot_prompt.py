@@ -1,10 +1,14 @@
 """
 Few-shot prompt generator that includes examples in the prompt.
 """
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from src.prompts.base_prompt_generator import BasePromptGenerator
 
+# Text framing the examples section, shared by all instances
+_EXAMPLES_HDR = "Here are some examples:"
+_EXAMPLES_FTR = "Now complete the task:"
+
 
 class FewShotPromptGenerator(BasePromptGenerator):
     """
@@ -12,6 +16,8 @@ class FewShotPromptGenerator(BasePromptGenerator):
     the model understand the task through few-shot learning.
     """
     
+    __slots__ = ("config", "field", "template", "examples", "_example_prefixes")
+    
     def __init__(self, config, field: str):
         """
         Initialize the few-shot prompt generator.
@@ -20,6 +26,7 @@ class FewShotPromptGenerator(BasePromptGenerator):
             config: Configuration containing prompt templates and examples
             field: The specific field in config that contains this prompt's template
         """
+        super().__init__()
         self.config = config
         self.field = field
         self.template = self.config.get_template(field)
@@ -30,43 +37,56 @@ class FewShotPromptGenerator(BasePromptGenerator):
         
         if not self.examples or not isinstance(self.examples, list):
             raise ValueError(f"Examples for field '{field}' not found or invalid format")
+        
+        # Example headers only depend on position, so build them once
+        self._example_prefixes = [f"Example {i+1}:\nInput: " for i in range(len(self.examples))]
     
-    def _format_examples(self, data: Dict[str, Any]) -> str:
+    def _iter_formatted_examples(self, data: Dict[str, Any]) -> Iterator[str]:
         """
         Format the examples with data where applicable.
         
+        Examples that cannot be formatted with the provided data are skipped.
+        
         Args:
             data: Dictionary containing values to be inserted into examples
             
-        Returns:
-            str: The formatted examples section
+        Yields:
+            str: Each formatted example
         """
-        formatted_examples = []
-        
-        for i, example in enumerate(self.examples):
+        for prefix, example in zip(self._example_prefixes, self.examples):
             try:
                 # If example is a string, format it directly
                 if isinstance(example, str):
-                    formatted_example = example.format(**data)
+                    yield example.format_map(data)
                 # If example is a dict, format input and output separately
                 elif isinstance(example, dict):
-                    input_text = example.get("input", "").format(**data)
+                    input_text = example.get("input", "").format_map(data)
                     output_text = example.get("output", "")
-                    formatted_example = f"Example {i+1}:\nInput: {input_text}\nOutput: {output_text}"
+                    yield f"{prefix}{input_text}\nOutput: {output_text}"
                 else:
-                    formatted_example = str(example)
-                
-                formatted_examples.append(formatted_example)
+                    yield str(example)
             except KeyError:
                 # Skip examples that can't be formatted with the provided data
                 continue
-        
-        return "\n\n".join(formatted_examples)
     
     def generate_prompt(self, data: Dict[str, Any]) -> str:
         """
         Generate a prompt with examples for few-shot learning.
         
+        Prompts for data made only of scalar values are memoized.
+        
+        Args:
+            data: Dictionary containing values to be inserted into the template
+            
+        Returns:
+            str: The formatted prompt with examples
+        """
+        return self._generate_cached(data, self._render)
+    
+    def _render(self, data: Dict[str, Any]) -> str:
+        """
+        Render the instruction template followed by the formatted examples.
+        
         Args:
             data: Dictionary containing values to be inserted into the template
             
@@ -75,16 +95,18 @@ class FewShotPromptGenerator(BasePromptGenerator):
         """
         try:
             # Format the main instruction template
-            instruction = self.template.format(**data)
+            instruction = self.template.format_map(data)
             
-            # Format the examples
-            examples_text = self._format_examples(data)
+            # Build instruction, header and examples as one flat list for a single join
+            pieces = [instruction, _EXAMPLES_HDR]
+            pieces.extend(self._iter_formatted_examples(data))
             
-            # Combine instruction with examples
-            if examples_text:
-                return f"{instruction}\n\nHere are some examples:\n\n{examples_text}\n\nNow complete the task:"
-            else:
+            # Without example text there is nothing to add to the instruction
+            if len(pieces) == 2 or (len(pieces) == 3 and not pieces[2]):
                 return instruction
+            
+            pieces.append(_EXAMPLES_FTR)
+            return "\n\n".join(pieces)
                 
         except KeyError as e:
             raise ValueError(f"Missing required data field: {e}")
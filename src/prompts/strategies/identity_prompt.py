@@ -5,6 +5,9 @@ from typing import Any, Dict
 
 from src.prompts.base_prompt_generator import BasePromptGenerator
 
+# Sentinel distinguishing an absent field from a field set to None
+_MISSING = object()
+
 
 class IdentityPromptGenerator(BasePromptGenerator):
     """
@@ -12,6 +15,8 @@ class IdentityPromptGenerator(BasePromptGenerator):
     This generator does not apply any transformation to the data.
     """
     
+    __slots__ = ("field",)
+    
     def __init__(self, config, field: str):
         """
         Initialize the identity prompt generator.
@@ -32,11 +37,10 @@ class IdentityPromptGenerator(BasePromptGenerator):
         Returns:
             str: The value of the specified field or empty string if field is not found
         """
-        if self.field not in data:
+        value = data.get(self.field, _MISSING)
+        if value is _MISSING:
             return ""
         
-        value = data.get(self.field)
-        
         # Handle non-string values
         if not isinstance(value, str):
             try:
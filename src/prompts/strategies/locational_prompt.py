@@ -1,10 +1,13 @@
 """
 Locational prompt generator that helps direct attention to specific areas of an image.
 """
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 
 from src.prompts.base_prompt_generator import BasePromptGenerator
 
+# Separator and header placed before the location information
+_LOCATION_HDR = "\n\nLocation Information:\n"
+
 
 class LocationalPromptGenerator(BasePromptGenerator):
     """
@@ -12,6 +15,11 @@ class LocationalPromptGenerator(BasePromptGenerator):
     locate specific areas of interest in an image or document.
     """
     
+    __slots__ = (
+        "config", "field", "template", "location_descriptions",
+        "_render_locations", "_location_prefixes",
+    )
+    
     def __init__(self, config, field: str):
         """
         Initialize the locational prompt generator.
@@ -27,6 +35,60 @@ class LocationalPromptGenerator(BasePromptGenerator):
         
         if not self.template:
             raise ValueError(f"Template for field '{field}' not found in configuration")
+        
+        # The container type is fixed, so pick the renderer once
+        self._render_locations = self._select_location_renderer()
+    
+    def _select_location_renderer(self) -> Callable[[Dict[str, Any]], str]:
+        """
+        Choose the renderer matching the type of the location descriptions.
+        
+        Returns:
+            Callable[[Dict[str, Any]], str]: Function rendering the descriptions with data
+        """
+        locations = self.location_descriptions
+        
+        if not locations:
+            return self._render_noop
+        
+        if isinstance(locations, str):
+            return self._render_str
+        
+        if isinstance(locations, list):
+            self._location_prefixes = [f"Location {i+1}: " for i in range(len(locations))]
+            return self._render_list
+        
+        if isinstance(locations, dict):
+            self._location_prefixes = [f"{loc_name}: " for loc_name in locations]
+            return self._render_dict
+        
+        return self._render_other
+    
+    def _render_noop(self, data: Dict[str, Any]) -> str:
+        """Render empty location information."""
+        return ""
+    
+    def _render_str(self, data: Dict[str, Any]) -> str:
+        """Render a single location description string."""
+        return self.location_descriptions.format_map(data)
+    
+    def _render_list(self, data: Dict[str, Any]) -> str:
+        """Render a list of location descriptions as numbered locations."""
+        return "\n".join(
+            prefix + location.format_map(data)
+            for prefix, location in zip(self._location_prefixes, self.location_descriptions)
+        )
+    
+    def _render_dict(self, data: Dict[str, Any]) -> str:
+        """Render named location descriptions."""
+        return "\n".join(
+            prefix + loc_desc.format_map(data)
+            for prefix, loc_desc in zip(self._location_prefixes, self.location_descriptions.values())
+        )
+    
+    def _render_other(self, data: Dict[str, Any]) -> str:
+        """Render location descriptions of any other type as a string."""
+        return str(self.location_descriptions)
     
     def _format_location_descriptions(self, data: Dict[str, Any]) -> str:
         """
@@ -36,34 +98,11 @@ class LocationalPromptGenerator(BasePromptGenerator):
             data: Dictionary containing values to be inserted into location descriptions
             
         Returns:
-            str: The formatted location descriptions
+            str: The formatted location descriptions, or an empty string if
+                the descriptions reference missing data
         """
-        if not self.location_descriptions:
-            return ""
-        
         try:
-            # If it's a string, format it directly
-            if isinstance(self.location_descriptions, str):
-                return self.location_descriptions.format(**data)
-            
-            # If it's a list, format each description
-            if isinstance(self.location_descriptions, list):
-                formatted_locations = []
-                for i, location in enumerate(self.location_descriptions):
-                    formatted_location = location.format(**data)
-                    formatted_locations.append(f"Location {i+1}: {formatted_location}")
-                return "\n".join(formatted_locations)
-                
-            # If it's a dict, format each key-value pair
-            if isinstance(self.location_descriptions, dict):
-                formatted_locations = []
-                for loc_name, loc_desc in self.location_descriptions.items():
-                    formatted_desc = loc_desc.format(**data)
-                    formatted_locations.append(f"{loc_name}: {formatted_desc}")
-                return "\n".join(formatted_locations)
-                
-            return str(self.location_descriptions)
-            
+            return self._render_locations(data)
         except KeyError:
             return ""
     
@@ -79,14 +118,14 @@ class LocationalPromptGenerator(BasePromptGenerator):
         """
         try:
             # Format the main instruction template
-            instruction = self.template.format(**data)
+            instruction = self.template.format_map(data)
             
             # Add location information if available
             location_info = self._format_location_descriptions(data)
             
             # Combine instruction with location information
             if location_info:
-                return f"{instruction}\n\nLocation Information:\n{location_info}"
+                return instruction + _LOCATION_HDR + location_info
             else:
                 return instruction
                 
@@ -12,6 +12,8 @@ class StepByStepPromptGenerator(BasePromptGenerator):
     guiding the model to solve problems step-by-step.
     """
     
+    __slots__ = ("config", "field", "introduction", "steps", "conclusion")
+    
     def __init__(self, config, field: str):
         """
         Initialize the step-by-step prompt generator.
@@ -44,20 +46,20 @@ class StepByStepPromptGenerator(BasePromptGenerator):
             
             # Add introduction if available
             if self.introduction:
-                intro_text = self.introduction.format(**data)
+                intro_text = self.introduction.format_map(data)
                 prompt_parts.append(intro_text)
             
             # Add numbered steps
             steps_text = []
             for i, step in enumerate(self.steps):
-                formatted_step = step.format(**data)
+                formatted_step = step.format_map(data)
                 steps_text.append(f"Step {i+1}: {formatted_step}")
             
             prompt_parts.append("\n".join(steps_text))
             
             # Add conclusion if available
             if self.conclusion:
-                conclusion_text = self.conclusion.format(**data)
+                conclusion_text = self.conclusion.format_map(data)
                 prompt_parts.append(conclusion_text)
             
             # Combine all parts
@@ -1,11 +1,48 @@
 """
 Template-based prompt generator that uses Jinja2 templates.
 """
+import functools
 from typing import Any, Dict
 import jinja2
 
 from src.prompts.base_prompt_generator import BasePromptGenerator
 
+# Number of compiled templates kept for reuse across generator instances
+_TEMPLATE_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=None)
+def _get_environment() -> jinja2.Environment:
+    """
+    Get the Jinja2 environment shared by all template prompt generators.
+    
+    Returns:
+        jinja2.Environment: The shared environment
+    """
+    return jinja2.Environment(
+        loader=jinja2.BaseLoader,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        autoescape=False
+    )
+
+
+@functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _compile_template(template_str: str) -> jinja2.Template:
+    """
+    Compile a template in the shared environment, reusing recent compilations.
+    
+    Args:
+        template_str: Jinja2 template source
+        
+    Returns:
+        jinja2.Template: The compiled template
+        
+    Raises:
+        jinja2.exceptions.TemplateSyntaxError: If the template is malformed
+    """
+    return _get_environment().from_string(template_str)
+
 
 class TemplatePromptGenerator(BasePromptGenerator):
     """
@@ -13,6 +50,8 @@ class TemplatePromptGenerator(BasePromptGenerator):
     Allows for advanced templating features like loops, conditionals, and filters.
     """
     
+    __slots__ = ("config", "field", "template_str", "env", "template")
+    
     def __init__(self, config, field: str):
         """
         Initialize the template prompt generator.
@@ -21,6 +60,7 @@ class TemplatePromptGenerator(BasePromptGenerator):
             config: Configuration containing prompt templates
             field: The specific field/key in config that contains the template
         """
+        super().__init__()
         self.config = config
         self.field = field
         self.template_str = self.config.get(field)
@@ -28,17 +68,12 @@ class TemplatePromptGenerator(BasePromptGenerator):
         if not self.template_str:
             raise ValueError(f"Template for field '{field}' not found in config")
         
-        # Initialize the Jinja2 environment
-        self.env = jinja2.Environment(
-            loader=jinja2.BaseLoader,
-            trim_blocks=True,
-            lstrip_blocks=True,
-            autoescape=False
-        )
+        # Use the shared Jinja2 environment
+        self.env = _get_environment()
         
-        # Compile the template
+        # Compile the template, reusing an earlier compilation of the same source
         try:
-            self.template = self.env.from_string(self.template_str)
+            self.template = _compile_template(self.template_str)
         except jinja2.exceptions.TemplateSyntaxError as e:
             raise ValueError(f"Invalid template syntax in field '{field}': {e}")
     
@@ -46,15 +81,33 @@ class TemplatePromptGenerator(BasePromptGenerator):
         """
         Generate a prompt by rendering the Jinja2 template with provided data.
         
+        Prompts for data made only of scalar values are memoized; data with
+        lists or mappings (e.g. for template loops) is rendered directly.
+        
+        Args:
+            data: Dictionary containing values to be rendered in the template
+            
+        Returns:
+            str: The rendered prompt
+        """
+        return self._generate_cached(data, self._render)
+    
+    def _render(self, data: Dict[str, Any]) -> str:
+        """
+        Render the compiled Jinja2 template with the provided data.
+        
         Args:
             data: Dictionary containing values to be rendered in the template
             
         Returns:
             str: The rendered prompt
+            
+        Raises:
+            ValueError: If the template uses undefined data or rendering fails
         """
         try:
-            return self.template.render(**data)
+            return self.template.render(data)
         except jinja2.exceptions.UndefinedError as e:
             raise ValueError(f"Missing data for template rendering: {e}")
         except Exception as e:
-            raise ValueError(f"Error rendering template: {e}") 
\ No newline at end of file
+            raise ValueError(f"Error rendering template: {e}")
@@ -7,14 +7,16 @@ in the invoice extraction system.
 from .base_visualizer import BaseVisualizer
 from .data_visualizer import DataVisualizer
 from .image_visualizer import ImageVisualizer
-from .results_visualizer import ResultsVisualizer
+from .results_visualizer import ResultsTable, ResultsVisualizer
 from .visualization_utils import (
+    add_field_values_text,
     save_figure,
     configure_matplotlib_defaults,
     create_figure,
     plot_confusion_matrix,
     plot_field_accuracy_bars,
-    plot_image_with_annotations
+    plot_image_with_annotations,
+    split_annotations
 )
 
 __all__ = [
@@ -22,10 +24,13 @@ __all__ = [
     'DataVisualizer',
     'ImageVisualizer',
     'ResultsVisualizer',
+    'ResultsTable',
+    'add_field_values_text',
     'save_figure',
     'configure_matplotlib_defaults',
     'create_figure',
     'plot_confusion_matrix',
     'plot_field_accuracy_bars',
-    'plot_image_with_annotations'
+    'plot_image_with_annotations',
+    'split_annotations'
 ]
@@ -4,11 +4,57 @@ This module defines the base interface for all visualizers in the system.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import io
 import logging
+import os
 from typing import Any, Dict, List, Optional, Tuple, Union
 import matplotlib.pyplot as plt
 
+from .style import DEFAULT_RC, DEFAULT_STYLE, PNG_PIL_KWARGS
+from .visualization_utils import save_figure
+
+# Set once the default style has been applied in this process
+_STYLE_APPLIED = False
+
+
+def _use_agg_backend() -> None:
+    """Switch a batch worker process to the non-interactive Agg backend."""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+def _render_png(
+    spec: Tuple[type, Dict[str, Any]],
+    method_name: str,
+    args: Tuple[Any, ...]
+) -> bytes:
+    """Build one figure with a fresh visualizer and encode it as PNG.
+    
+    Runs in batch worker processes, so it only takes picklable arguments.
+    
+    Args:
+        spec: Tuple of (visualizer class, constructor keyword arguments)
+        method_name: Name of the visualizer method that builds the figure
+        args: Positional arguments for that method
+        
+    Returns:
+        PNG-encoded figure
+    """
+    cls, init_kwargs = spec
+    visualizer = cls(**init_kwargs)
+    fig = getattr(visualizer, method_name)(*args)
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(
+            buffer, format='png', dpi=visualizer.dpi, bbox_inches='tight',
+            pil_kwargs=dict(PNG_PIL_KWARGS)
+        )
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
 
 class BaseVisualizer(ABC):
     """Base interface for all visualizers.
@@ -56,7 +102,8 @@ class BaseVisualizer(ABC):
         self, 
         fig: plt.Figure, 
         filename: Union[str, Path], 
-        formats: Optional[List[str]] = None
+        formats: Optional[List[str]] = None,
+        dpi: Optional[int] = None
     ) -> List[Path]:
         """Save the figure to disk in specified formats.
         
@@ -64,23 +111,49 @@ class BaseVisualizer(ABC):
             fig: Matplotlib Figure to save
             filename: Base filename (without extension)
             formats: List of formats to save as (default: self.output_formats)
+            dpi: Resolution to save at (default: self.dpi)
             
         Returns:
             List of paths to saved files
         """
-        formats = formats or self.output_formats
-        saved_files = []
+        return save_figure(fig, filename, formats or self.output_formats, dpi or self.dpi)
         
-        for fmt in formats:
-            output_path = Path(f"{filename}.{fmt}")
-            try:
-                fig.savefig(output_path, format=fmt, dpi=self.dpi, bbox_inches='tight')
-                saved_files.append(output_path)
-                self._logger.debug(f"Saved figure to {output_path}")
-            except Exception as e:
-                self._logger.error(f"Failed to save figure as {fmt}: {str(e)}")
-                
-        return saved_files
+    def _render_batch(
+        self,
+        method_name: str,
+        items: List[Tuple[Any, ...]],
+        max_workers: Optional[int] = None
+    ) -> List[bytes]:
+        """Render many independent figures in worker processes.
+        
+        Each worker builds its figures with a visualizer configured like
+        this one and returns PNG bytes, since Figure objects do not pickle
+        reliably across processes.
+        
+        Args:
+            method_name: Name of the method that builds each figure
+            items: Positional argument tuples, one per figure
+            max_workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            List of PNG-encoded figures in the order of items
+        """
+        spec = (type(self), {
+            'fig_size': self.fig_size,
+            'dpi': self.dpi,
+            'output_formats': self.output_formats
+        })
+        max_workers = min(max_workers or os.cpu_count() or 1, len(items))
+        if max_workers <= 1:
+            return [_render_png(spec, method_name, args) for args in items]
+            
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_use_agg_backend) as executor:
+            return list(executor.map(
+                _render_png,
+                [spec] * len(items),
+                [method_name] * len(items),
+                items
+            ))
         
     def create_figure(self) -> Tuple[plt.Figure, plt.Axes]:
         """Create a new figure with default settings.
@@ -92,13 +165,14 @@ class BaseVisualizer(ABC):
         return fig, ax
         
     def configure_default_style(self) -> None:
-        """Configure default matplotlib style settings."""
-        plt.style.use('seaborn-v0_8-whitegrid')
-        plt.rcParams['font.family'] = 'sans-serif'
-        plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
-        plt.rcParams['axes.labelsize'] = 12
-        plt.rcParams['axes.titlesize'] = 14
-        plt.rcParams['xtick.labelsize'] = 10
-        plt.rcParams['ytick.labelsize'] = 10
-        plt.rcParams['legend.fontsize'] = 10
-        plt.rcParams['figure.titlesize'] = 16 
\ No newline at end of file
+        """Configure default matplotlib style settings.
+        
+        The style sheet and rcParams are global, so they are applied once
+        per process; later calls are no-ops.
+        """
+        global _STYLE_APPLIED
+        if _STYLE_APPLIED:
+            return
+        plt.style.use(DEFAULT_STYLE)
+        plt.rcParams.update(DEFAULT_RC)
+        _STYLE_APPLIED = True
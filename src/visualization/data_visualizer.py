@@ -4,16 +4,68 @@ This module provides visualizations for tabular data and statistics
 in the invoice extraction system.
 """
 
+import functools
 import logging
+import weakref
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .base_visualizer import BaseVisualizer
 from .visualization_utils import create_figure
 
+# Violin KDEs converge well below this many rows, so larger frames are subsampled
+_MAX_VIOLIN_SAMPLES = 20_000
+
+# Correlation heatmaps wider than this only annotate their strongest cells
+_MAX_ANNOTATED_COLS = 20
+_TOP_K_ANNOTATIONS = 20
+
+
+@functools.lru_cache(maxsize=None)
+def _corr_cmap() -> Any:
+    """Return the diverging colormap used for correlation heatmaps.
+    
+    Built once on first use, which also keeps the seaborn import lazy.
+    
+    Returns:
+        Matplotlib colormap
+    """
+    import seaborn as sns
+    
+    return sns.diverging_palette(230, 20, as_cmap=True)
+
+
+def _to_fortran_block(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the frame with each column stored contiguously.
+    
+    A frame built from a C-ordered 2D array keeps that array as its block,
+    so every column read strides across rows. Column-wise reductions such
+    as corr and melt are much faster on per-column contiguous storage.
+    Frames that are already column-contiguous, that span several blocks,
+    or that hold object or extension dtypes are returned unchanged without
+    being converted.
+    
+    Args:
+        df: DataFrame to relayout
+        
+    Returns:
+        DataFrame with column-contiguous values
+    """
+    # Only a single block of one NumPy dtype converts to an array without
+    # copying, so check the layout before calling to_numpy
+    if not df._mgr.is_single_block:
+        return df
+    dtype = df.dtypes.iloc[0]
+    if not isinstance(dtype, np.dtype) or dtype == object:
+        return df
+        
+    arr = df.to_numpy()
+    if arr.flags.f_contiguous:
+        return df
+    return pd.DataFrame(np.asfortranarray(arr), index=df.index, columns=df.columns, copy=False)
+
 
 class DataVisualizer(BaseVisualizer):
     """Visualizer for tabular data and statistics.
@@ -43,6 +95,34 @@ class DataVisualizer(BaseVisualizer):
         super().__init__(fig_size=fig_size, dpi=dpi, output_formats=output_formats)
         self._logger = logging.getLogger(__name__)
         
+        # Numeric column names per DataFrame, keyed by id() and dropped when the frame is freed
+        self._numeric_cache: Dict[int, Tuple[pd.Index, Tuple[np.dtype, ...], List[str]]] = {}
+        
+    def _numeric_cols(self, data: pd.DataFrame) -> List[str]:
+        """Get the numeric column names of a DataFrame, cached per frame.
+        
+        The cached entry is reused while the frame keeps the same columns
+        Index object and the same column dtypes, so adding or removing
+        columns, or converting a column in place, refreshes it.
+        
+        Args:
+            data: DataFrame to inspect
+            
+        Returns:
+            List of numeric column names
+        """
+        key = id(data)
+        dtypes = tuple(data.dtypes)
+        cached = self._numeric_cache.get(key)
+        if cached is not None and cached[0] is data.columns and cached[1] == dtypes:
+            return cached[2]
+            
+        numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
+        if cached is None:
+            weakref.finalize(data, self._numeric_cache.pop, key, None)
+        self._numeric_cache[key] = (data.columns, dtypes, numeric_cols)
+        return numeric_cols
+        
     def visualize(self, data: pd.DataFrame) -> plt.Figure:
         """Visualize a pandas DataFrame.
         
@@ -81,6 +161,22 @@ class DataVisualizer(BaseVisualizer):
         
         return fig
         
+    def batch_visualize(
+        self,
+        dfs: List[pd.DataFrame],
+        max_workers: Optional[int] = None
+    ) -> List[bytes]:
+        """Render overview dashboards for many DataFrames in parallel.
+        
+        Args:
+            dfs: DataFrames to visualize
+            max_workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            List of PNG-encoded dashboards, one per DataFrame
+        """
+        return self._render_batch('visualize', [(df,) for df in dfs], max_workers)
+        
     def plot_missing_values(self, data: pd.DataFrame) -> plt.Figure:
         """Visualize missing values in a DataFrame.
         
@@ -102,8 +198,8 @@ class DataVisualizer(BaseVisualizer):
             data: DataFrame to visualize
             ax: Matplotlib Axes to plot on
         """
-        # Calculate missing values by column
-        missing = data.isnull().sum().sort_values(ascending=False)
+        # Calculate missing values by column (count() avoids building a full null mask)
+        missing = (len(data) - data.count()).sort_values(ascending=False)
         missing_pct = (missing / len(data) * 100).round(2)
         
         # Filter to only show columns with missing values
@@ -124,20 +220,19 @@ class DataVisualizer(BaseVisualizer):
         })
         
         # Plot as horizontal bars
-        missing_df['Percent'].sort_values().plot(
+        sorted_pct = missing_df['Percent'].sort_values()
+        sorted_pct.plot(
             kind='barh',
             color='#3498db',
             ax=ax
         )
         
-        # Add percentage labels
-        for i, (idx, row) in enumerate(missing_df.iterrows()):
-            ax.text(
-                row['Percent'] + 0.5, 
-                i, 
-                f"{row['Percent']}% ({row['Count']})",
-                va='center'
-            )
+        # Add percentage labels in the same order as the bars
+        pct = sorted_pct.to_numpy()
+        cnt = missing_df['Count'].reindex(sorted_pct.index).to_numpy()
+        labels = [f"{p}% ({c})" for p, c in zip(pct, cnt)]
+        for i, (p, label) in enumerate(zip(pct, labels)):
+            ax.text(p + 0.5, i, label, va='center')
             
         ax.set_title("Missing Values by Column")
         ax.set_xlabel("Percentage of Missing Values")
@@ -171,8 +266,10 @@ class DataVisualizer(BaseVisualizer):
             ax: Matplotlib Axes to plot on
             columns: List of columns to include (default: all numeric columns)
         """
+        import seaborn as sns
+
         # Filter to numeric columns
-        numeric_cols = columns or data.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = columns or self._numeric_cols(data)
         
         if not numeric_cols:
             ax.text(0.5, 0.5, "No numeric columns to display", 
@@ -185,8 +282,13 @@ class DataVisualizer(BaseVisualizer):
             numeric_cols = numeric_cols[:6]
             self._logger.warning(f"Too many numeric columns. Showing only first 6.")
             
+        # Subsample large frames deterministically before estimating densities
+        sample = data[numeric_cols]
+        if len(sample) > _MAX_VIOLIN_SAMPLES:
+            sample = sample.sample(n=_MAX_VIOLIN_SAMPLES, random_state=0)
+            
         # Create distribution plots
-        plot_data = data[numeric_cols].melt(var_name='Column', value_name='Value')
+        plot_data = _to_fortran_block(sample).melt(var_name='Column', value_name='Value')
         sns.violinplot(
             x='Column', 
             y='Value', 
@@ -218,23 +320,89 @@ class DataVisualizer(BaseVisualizer):
             data: DataFrame to visualize
             ax: Matplotlib Axes to plot on
         """
-        # Get counts of each data type
-        dtype_counts = pd.Series(data.dtypes).value_counts()
+        import seaborn as sns
+
+        # Count dtype names directly; there are only a handful of distinct ones
+        names = np.fromiter((str(dtype) for dtype in data.dtypes.values), dtype=object)
+        labels, counts = np.unique(names, return_counts=True)
         
-        # Convert dtype objects to strings for consistent display
-        dtype_counts.index = [str(dtype) for dtype in dtype_counts.index]
+        # Largest slices first, as value_counts would order them
+        order = np.argsort(-counts, kind='stable')
+        labels, counts = labels[order], counts[order]
         
         # Create pie chart
         ax.pie(
-            dtype_counts,
-            labels=dtype_counts.index,
+            counts,
+            labels=labels,
             autopct='%1.1f%%',
             startangle=90,
-            colors=sns.color_palette('Set3', len(dtype_counts))
+            colors=sns.color_palette('Set3', len(counts))
         )
         
         ax.set_title(f"Data Types (Total Columns: {len(data.columns)})")
         
+    def _pearson_corr(self, numeric_data: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Compute a Pearson correlation matrix with a single matrix product.
+        
+        Columns are centered and scaled to unit norm in place, so X.T @ X is
+        the correlation matrix and runs as one float64 matrix product.
+        
+        Args:
+            numeric_data: DataFrame containing only numeric columns
+            
+        Returns:
+            Correlation matrix, or None if the data has missing values and
+            needs pandas' pairwise-complete handling
+        """
+        arr = numeric_data.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        if np.isnan(arr).any():
+            return None
+            
+        arr -= arr.mean(axis=0)
+        norms = np.sqrt(np.einsum('ij,ij->j', arr, arr))
+        
+        # Constant columns produce NaN correlations, as they do in pandas
+        with np.errstate(divide='ignore', invalid='ignore'):
+            arr /= norms
+        corr = arr.T @ arr
+        np.clip(corr, -1.0, 1.0, out=corr)
+        return pd.DataFrame(corr, index=numeric_data.columns, columns=numeric_data.columns)
+        
+    def _annotate_strongest(
+        self,
+        ax: plt.Axes,
+        values: np.ndarray,
+        mask: np.ndarray,
+        cmap: Any
+    ) -> None:
+        """Annotate the unmasked heatmap cells with the largest absolute values.
+        
+        Args:
+            ax: Axes holding the heatmap
+            values: Correlation matrix values
+            mask: Boolean mask of cells hidden in the heatmap
+            cmap: Colormap of the heatmap, used to pick a readable text color
+        """
+        import seaborn as sns
+
+        rows, cols = np.nonzero(~mask)
+        cell_values = values[rows, cols]
+        strength = np.nan_to_num(np.abs(cell_values), nan=-1.0)
+        k = min(_TOP_K_ANNOTATIONS, len(cell_values))
+        if k == 0:
+            return
+            
+        for idx in np.argpartition(strength, -k)[-k:]:
+            value = cell_values[idx]
+            if np.isnan(value):
+                continue
+            luminance = sns.utils.relative_luminance(cmap((value + 1) / 2))
+            ax.text(
+                cols[idx] + 0.5, rows[idx] + 0.5, f"{value:.2f}",
+                ha='center', va='center', fontsize=8,
+                color='w' if luminance <= 0.408 else 'k'
+            )
+        
     def plot_correlations(self, data: pd.DataFrame, method: str = 'pearson') -> plt.Figure:
         """Visualize correlations between numeric columns.
         
@@ -245,8 +413,10 @@ class DataVisualizer(BaseVisualizer):
         Returns:
             Matplotlib Figure with correlation heatmap
         """
+        import seaborn as sns
+
         # Filter to numeric columns
-        numeric_data = data.select_dtypes(include=['number'])
+        numeric_data = _to_fortran_block(data[self._numeric_cols(data)])
         
         if numeric_data.shape[1] < 2:
             fig, ax = self.create_figure()
@@ -257,7 +427,9 @@ class DataVisualizer(BaseVisualizer):
             return fig
             
         # Calculate correlation matrix
-        corr = numeric_data.corr(method=method)
+        corr = self._pearson_corr(numeric_data) if method == 'pearson' else None
+        if corr is None:
+            corr = numeric_data.corr(method=method)
         
         # Create figure (adjust size based on number of columns)
         n_cols = len(corr.columns)
@@ -266,8 +438,11 @@ class DataVisualizer(BaseVisualizer):
         
         # Create heatmap
         mask = np.triu(np.ones_like(corr, dtype=bool))
-        cmap = sns.diverging_palette(230, 20, as_cmap=True)
+        cmap = _corr_cmap()
         
+        # Annotating every cell creates n^2 text artists, so wide matrices
+        # only label their strongest correlations
+        annotate_all = n_cols <= _MAX_ANNOTATED_COLS
         sns.heatmap(
             corr,
             mask=mask,
@@ -276,12 +451,14 @@ class DataVisualizer(BaseVisualizer):
             vmin=-1,
             center=0,
             square=True,
-            linewidths=0.5,
+            linewidths=0.5 if annotate_all else 0,
             cbar_kws={"shrink": 0.8},
-            annot=True,
+            annot=annotate_all,
             fmt=".2f",
             ax=ax
         )
+        if not annotate_all:
+            self._annotate_strongest(ax, corr.to_numpy(), mask, cmap)
         
         ax.set_title(f"Correlation Matrix ({method.capitalize()})")
         fig.tight_layout()
@@ -4,17 +4,92 @@ This module provides visualizations for invoice images and annotations
 in the invoice extraction system.
 """
 
+import functools
 import logging
+import math
+import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import PatchCollection
+from matplotlib.image import pil_to_array
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from PIL import Image, ImageDraw, ImageFont
 
 from .base_visualizer import BaseVisualizer
-from .visualization_utils import plot_image_with_annotations
+from .visualization_utils import (
+    add_field_values_text,
+    plot_image_with_annotations,
+    split_annotations
+)
+
+# Number of decoded invoice images kept in memory (a 12MP RGB scan is ~36MB)
+_IMAGE_CACHE_SIZE = 8
+
+# Annotation sets at least this large are drawn into the image with PIL
+# instead of as one matplotlib artist per box and label
+_RASTERIZE_MIN_FIELDS = 20
+
+
+@functools.lru_cache(maxsize=_IMAGE_CACHE_SIZE)
+def _load_image_cached(
+    path_str: str,
+    mtime: float,
+    draft_size: Optional[Tuple[int, int]] = None
+) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Load and decode an image file, cached by path and modification time.
+    
+    Args:
+        path_str: Path to the image file
+        mtime: Modification time of the file, so edited files are reloaded
+        draft_size: If given, the (width, height) box the image is displayed
+            in; JPEG files are then decoded at the smallest DCT scale
+            (1/2, 1/4 or 1/8) that still fills the box at the image's aspect
+        
+    Returns:
+        Tuple of (decoded PIL Image detached from the file handle, size of
+        the full-resolution image). The image is shared between callers and
+        must not be modified in place.
+    """
+    with Image.open(path_str) as img:
+        full_size = img.size
+        scale = min(draft_size[0] / img.width, draft_size[1] / img.height) if draft_size else 1
+        if scale < 1 and img.format == 'JPEG':
+            img.draft('RGB', (math.ceil(img.width * scale), math.ceil(img.height * scale)))
+        return img.copy(), full_size
+
+
+def _load_image(image: Union[str, Path]) -> Image.Image:
+    """Load an image file at full resolution through the decoded-image cache.
+    
+    Args:
+        image: Path to the image file
+        
+    Returns:
+        Decoded PIL Image (shared; copy before modifying)
+    """
+    path_str = os.fspath(image)
+    return _load_image_cached(path_str, os.path.getmtime(path_str))[0]
+
+
+def _load_display_image(
+    image: Union[str, Path],
+    draft_size: Tuple[int, int]
+) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Load an image file for display, letting JPEG decode at reduced size.
+    
+    Args:
+        image: Path to the image file
+        draft_size: (width, height) box the image is displayed in
+        
+    Returns:
+        Tuple of (decoded PIL Image (shared; copy before modifying),
+        size of the full-resolution image)
+    """
+    path_str = os.fspath(image)
+    return _load_image_cached(path_str, os.path.getmtime(path_str), draft_size)
 
 
 class ImageVisualizer(BaseVisualizer):
@@ -45,6 +120,95 @@ class ImageVisualizer(BaseVisualizer):
         super().__init__(fig_size=fig_size, dpi=dpi, output_formats=output_formats)
         self._logger = logging.getLogger(__name__)
         
+    def _display_size(self) -> Tuple[int, int]:
+        """Return the pixel size the figure is rasterized at.
+        
+        Returns:
+            Tuple of (width, height) in pixels
+        """
+        return (int(self.fig_size[0] * self.dpi), int(self.fig_size[1] * self.dpi))
+        
+    def _prepare_display_image(
+        self,
+        img: Image.Image,
+        full_size: Optional[Tuple[int, int]] = None
+    ) -> Tuple[np.ndarray, Optional[Tuple[float, float, float, float]]]:
+        """Downscale an oversized image to the rendered figure size.
+        
+        The figure is rasterized at fig_size * dpi pixels, so resampling a
+        much larger image on every draw is wasted work. The returned extent
+        keeps the axes in original pixel coordinates, so annotations drawn
+        at full-resolution positions still line up.
+        
+        The image is returned as a C-contiguous array so it can be shared
+        between axes and passed to imshow without further conversion.
+        
+        Args:
+            img: Image to display
+            full_size: Full-resolution size if img was decoded at reduced
+                size (default: img.size)
+            
+        Returns:
+            Tuple of (pixel array to pass to imshow, extent for imshow or None)
+        """
+        target = self._display_size()
+        width, height = full_size or img.size
+        rescaled = img.size != (width, height)
+        if img.width * img.height > 2 * target[0] * target[1]:
+            img = img.copy()
+            img.thumbnail(target, Image.Resampling.LANCZOS)
+            rescaled = True
+            
+        extent = (-0.5, width - 0.5, height - 0.5, -0.5) if rescaled else None
+        return np.ascontiguousarray(pil_to_array(img)), extent
+        
+    def _rasterize_annotations(
+        self,
+        img: Image.Image,
+        annotations: Dict[str, Union[Tuple[int, int, int, int], List[Tuple[int, int]]]]
+    ) -> Image.Image:
+        """Draw boxes, point lists and their labels directly into a copy of an image.
+        
+        Line widths and label sizes are scaled with the image so they stay
+        readable once the image is downscaled to the figure size.
+        
+        Args:
+            img: Image to annotate (not modified)
+            annotations: Dictionary mapping field names to bounding boxes
+                (x, y, width, height) or point coordinates [(x1, y1), ...]
+                
+        Returns:
+            New RGB image with the annotations drawn in
+        """
+        canvas = img.convert('RGB')
+        draw = ImageDraw.Draw(canvas)
+        scale = max(1.0, img.width / (self.fig_size[0] * self.dpi))
+        line_width = round(2 * scale)
+        try:
+            # 10pt labels at the figure dpi; sized fonts need Pillow >= 10.1
+            font = ImageFont.load_default(size=round(10 * self.dpi / 72 * scale))
+        except TypeError:
+            font = ImageFont.load_default()
+        
+        boxes, polylines = split_annotations(annotations)
+        for field_name in annotations:
+            if field_name in boxes:
+                x, y, width, height = boxes[field_name]
+                draw.rectangle([x, y, x + width, y + height], outline='red', width=line_width)
+            elif field_name in polylines:
+                points = polylines[field_name]
+                x, y = points[0].tolist()
+                draw.line(points.ravel().tolist(), fill='red', width=line_width)
+            else:
+                continue
+                
+            # Label sits just above the annotation on a white background
+            label_pos = (x, max(0, y - line_width - font.getbbox(str(field_name))[3]))
+            draw.rectangle(draw.textbbox(label_pos, str(field_name), font=font), fill='white')
+            draw.text(label_pos, str(field_name), fill='red', font=font)
+            
+        return canvas
+        
     def visualize(self, data: Union[Image.Image, str, Path]) -> plt.Figure:
         """Visualize an invoice image.
         
@@ -73,7 +237,7 @@ class ImageVisualizer(BaseVisualizer):
         # Load image if it's a path
         if isinstance(image, (str, Path)):
             try:
-                img = Image.open(image)
+                img, full_size = _load_display_image(image, self._display_size())
                 path_str = str(image)
             except Exception as e:
                 self._logger.error(f"Failed to open image {image}: {str(e)}")
@@ -83,20 +247,22 @@ class ImageVisualizer(BaseVisualizer):
                 ax.axis('off')
                 return fig
         else:
-            img = image
+            img, full_size = image, None
             path_str = "image object"
             
         # Create figure
         fig, ax = plt.subplots(figsize=self.fig_size, dpi=self.dpi)
         
         # Display image
-        ax.imshow(img)
+        display_img, extent = self._prepare_display_image(img, full_size)
+        ax.imshow(display_img, extent=extent, interpolation='none')
         ax.set_title(title)
         
-        # Add image info as text
+        # Add image info as text, reporting the full size of draft-decoded images
+        width, height = full_size or img.size
         ax.text(
             0.01, 0.01, 
-            f"Size: {img.width}x{img.height}, Mode: {img.mode}",
+            f"Size: {width}x{height}, Mode: {img.mode}",
             transform=ax.transAxes,
             fontsize=8,
             verticalalignment='bottom',
@@ -133,7 +299,7 @@ class ImageVisualizer(BaseVisualizer):
         # Load image if it's a path
         if isinstance(image, (str, Path)):
             try:
-                img = Image.open(image)
+                img, full_size = _load_display_image(image, self._display_size())
             except Exception as e:
                 self._logger.error(f"Failed to open image {image}: {str(e)}")
                 fig, ax = self.create_figure()
@@ -142,7 +308,7 @@ class ImageVisualizer(BaseVisualizer):
                 ax.axis('off')
                 return fig
         else:
-            img = image
+            img, full_size = image, None
             
         # Create figure
         fig, axs = plt.subplots(
@@ -157,46 +323,31 @@ class ImageVisualizer(BaseVisualizer):
             axs = [axs]
             
         # Display image
-        axs[0].imshow(img)
+        display_img, extent = self._prepare_display_image(img, full_size)
+        axs[0].imshow(display_img, extent=extent, interpolation='none')
         axs[0].set_title(title)
         axs[0].axis('off')
         
         # Add extracted field values to the image
-        y_pos = 0.05
-        for field, value in extracted_fields.items():
-            # Format the field-value text
-            text = f"{field}: {value}"
-            
-            # Add text with colored background
-            axs[0].text(
-                0.02, y_pos, 
-                text,
-                transform=axs[0].transAxes,
-                fontsize=10,
-                verticalalignment='bottom',
-                bbox=dict(facecolor='white', alpha=0.8, edgecolor='blue', pad=3)
-            )
-            
-            y_pos += 0.06  # Move down for next field
+        add_field_values_text(axs[0], extracted_fields)
             
         # Add comparison if ground truth is provided
         if ground_truth:
             axs[1].axis('off')
             axs[1].set_title("Comparison")
             
-            # Create a table for comparison
-            table_data = []
-            colors = []
+            # Create a table for comparison, matching all rows at once
+            # (simple string comparison)
+            fields = np.array([str(field) for field in ground_truth], dtype=str)
+            extracted = np.array(
+                [str(extracted_fields.get(field, "")) for field in ground_truth], dtype=str
+            )
+            expected = np.array([str(value) for value in ground_truth.values()], dtype=str)
+            match = np.char.strip(extracted) == np.char.strip(expected)
             
-            for field, gt_value in ground_truth.items():
-                extracted_value = extracted_fields.get(field, "")
-                
-                # Determine if values match (simple string comparison)
-                match = str(extracted_value).strip() == str(gt_value).strip()
-                row_color = 'lightgreen' if match else 'lightcoral'
-                
-                table_data.append([field, str(extracted_value), str(gt_value)])
-                colors.append([row_color, row_color, row_color])
+            row_colors = np.where(match, 'lightgreen', 'lightcoral')
+            colors = np.repeat(row_colors[:, None], 3, axis=1).tolist()
+            table_data = np.stack([fields, extracted, expected], axis=1).tolist()
                 
             # Create the table
             table = axs[1].table(
@@ -215,6 +366,23 @@ class ImageVisualizer(BaseVisualizer):
         fig.tight_layout()
         return fig
         
+    def batch_visualize_with_fields(
+        self,
+        items: List[Tuple[Any, ...]],
+        max_workers: Optional[int] = None
+    ) -> List[bytes]:
+        """Render extracted-field views for many invoices in parallel.
+        
+        Args:
+            items: Argument tuples for visualize_with_extracted_fields, i.e.
+                (image, extracted_fields[, ground_truth[, title]])
+            max_workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            List of PNG-encoded figures, one per item
+        """
+        return self._render_batch('visualize_with_extracted_fields', items, max_workers)
+        
     def visualize_field_locations(
         self,
         image: Union[Image.Image, str, Path],
@@ -231,6 +399,21 @@ class ImageVisualizer(BaseVisualizer):
         Returns:
             Matplotlib Figure with annotated image
         """
+        # Load through the cache so repeated views of an invoice decode it once
+        if isinstance(image, (str, Path)):
+            image = _load_image(image)
+            
+        if isinstance(image, Image.Image) and len(field_locations) >= _RASTERIZE_MIN_FIELDS:
+            fig, ax = plt.subplots(figsize=self.fig_size, dpi=self.dpi)
+            display_img, extent = self._prepare_display_image(
+                self._rasterize_annotations(image, field_locations)
+            )
+            ax.imshow(display_img, extent=extent, interpolation='none')
+            ax.set_title(title)
+            ax.axis('off')
+            fig.tight_layout()
+            return fig
+            
         return plot_image_with_annotations(
             image=image,
             annotations=field_locations,
@@ -267,7 +450,7 @@ class ImageVisualizer(BaseVisualizer):
         # Load image if it's a path
         if isinstance(image, (str, Path)):
             try:
-                img = Image.open(image)
+                img, full_size = _load_display_image(image, self._display_size())
             except Exception as e:
                 self._logger.error(f"Failed to open image {image}: {str(e)}")
                 fig, ax = self.create_figure()
@@ -276,7 +459,7 @@ class ImageVisualizer(BaseVisualizer):
                 ax.axis('off')
                 return fig
         else:
-            img = image
+            img, full_size = image, None
             
         # Create figure with subplots
         n = len(annotations_list)
@@ -291,20 +474,20 @@ class ImageVisualizer(BaseVisualizer):
             axs = [axs]
             
         # Create visualizations
+        # Converted once so every subplot shares one pixel buffer instead of
+        # imshow converting the PIL image again for each axes
+        display_img, extent = self._prepare_display_image(img, full_size)
         for i, (annotations, title) in enumerate(zip(annotations_list, titles)):
-            axs[i].imshow(img)
+            axs[i].imshow(display_img, extent=extent, interpolation='none')
             axs[i].set_title(title)
             
-            # Add annotations
+            # Add annotations; boxes are collected and drawn as one collection
+            boxes = []
             for field_name, value in annotations.items():
                 if isinstance(value, tuple) and len(value) == 4:
                     # Bounding box (x, y, width, height)
                     x, y, width, height = value
-                    rect = patches.Rectangle(
-                        (x, y), width, height, 
-                        linewidth=2, edgecolor='red', facecolor='none', alpha=0.7
-                    )
-                    axs[i].add_patch(rect)
+                    boxes.append(patches.Rectangle((x, y), width, height))
                     
                     # Add field name label
                     axs[i].text(
@@ -324,6 +507,11 @@ class ImageVisualizer(BaseVisualizer):
                         verticalalignment='bottom',
                         bbox=dict(facecolor='white', alpha=0.8, edgecolor='blue', pad=3)
                     )
+                    
+            if boxes:
+                axs[i].add_collection(PatchCollection(
+                    boxes, linewidth=2, edgecolor='red', facecolor='none', alpha=0.7
+                ))
             
             # Hide axes
             axs[i].axis('off')
@@ -4,16 +4,166 @@ This module provides visualizations for evaluation results and comparisons
 in the invoice extraction system.
 """
 
+import functools
 import logging
+import numbers
+from dataclasses import dataclass, field
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .base_visualizer import BaseVisualizer
 from .visualization_utils import plot_field_accuracy_bars
 
+# Heatmaps with more cells than this are drawn without value annotations
+_MAX_ANNOTATED_CELLS = 400
+
+
+@functools.lru_cache(maxsize=16)
+def _muted_palette(n_colors: int) -> Tuple[Tuple[float, float, float], ...]:
+    """Return seaborn's "muted" palette with the given number of colors.
+    
+    Cached per size, which also keeps the seaborn import lazy.
+    
+    Args:
+        n_colors: Number of colors
+        
+    Returns:
+        Tuple of RGB colors
+    """
+    import seaborn as sns
+    
+    return tuple(sns.color_palette("muted", n_colors))
+
+
+def _max_name_length(names: Any) -> int:
+    """Return the length of the longest name, or 0 if there are none.
+    
+    Args:
+        names: Sequence or array of names
+        
+    Returns:
+        Length of the longest name
+    """
+    if len(names) == 0:
+        return 0
+    return int(np.char.str_len(np.asarray(names, dtype=str)).max())
+
+
+@dataclass
+class ResultsTable:
+    """Per-model metrics stored as one dense matrix.
+    
+    Attributes:
+        models: Model (or prompt) names, one per row
+        metric_names: Metric names, one per column
+        values: float32 matrix of shape (len(models), len(metric_names));
+            metrics a model did not report are 0
+        name_maxlen: Length of the longest model name, used to decide on
+            tick label rotation
+    """
+    models: np.ndarray
+    metric_names: np.ndarray
+    values: np.ndarray
+    name_maxlen: int = field(init=False, repr=False)
+    _sort_orders: Dict[str, np.ndarray] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    
+    def __post_init__(self) -> None:
+        """Compute derived attributes."""
+        self.name_maxlen = _max_name_length(self.models)
+        
+    @classmethod
+    def from_dict(cls, model_results: Dict[str, Dict[str, Any]]) -> "ResultsTable":
+        """Build a table from a mapping of model names to metric dictionaries.
+        
+        Non-numeric entries (e.g. lists of missing fields in summary results)
+        are left out of the table.
+        
+        Args:
+            model_results: Dictionary mapping model names to result dictionaries
+            
+        Returns:
+            ResultsTable with models and metrics in first-seen order
+        """
+        numeric = [
+            {k: v for k, v in results.items() if isinstance(v, numbers.Real)}
+            for results in model_results.values()
+        ]
+        metric_names = list(dict.fromkeys(k for results in numeric for k in results))
+        values = (
+            pd.DataFrame(numeric, columns=metric_names)
+            .fillna(0.0)
+            .to_numpy(dtype=np.float32)
+            .reshape(len(numeric), len(metric_names))
+        )
+        return cls(
+            models=np.array(list(model_results), dtype=object),
+            metric_names=np.array(metric_names, dtype=object),
+            values=values
+        )
+        
+    def column(self, metric: str) -> np.ndarray:
+        """Return one metric for every model.
+        
+        Args:
+            metric: Metric name
+            
+        Returns:
+            float32 array with one value per model (zeros if no model
+            reported the metric)
+        """
+        matches = np.flatnonzero(self.metric_names == metric)
+        if len(matches) == 0:
+            return np.zeros(len(self.models), dtype=np.float32)
+        return self.values[:, matches[0]]
+        
+    def sorted_by(self, metric: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return models and their values ordered by descending metric value.
+        
+        The sort order is computed once per metric and reused by later
+        calls, so the table's values must not be modified after the first call.
+        
+        Args:
+            metric: Metric name
+            
+        Returns:
+            Tuple of (model names, float32 metric values), best first
+        """
+        order = self._sort_orders.get(metric)
+        if order is None:
+            order = np.argsort(-self.column(metric), kind='stable')  # Descending order
+            self._sort_orders[metric] = order
+        return self.models[order], self.column(metric)[order]
+
+
+def field_result_arrays(field_results: Dict[str, Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Convert per-field result dictionaries into parallel arrays.
+    
+    Callers rendering the same results repeatedly can convert once and pass
+    the arrays to ResultsVisualizer.visualize_field_results.
+    
+    Args:
+        field_results: Dictionary mapping field names to result dictionaries
+        
+    Returns:
+        Dictionary with "fields" (field names) and boolean "missing_gt",
+        "missing_ext" and "norm_match" arrays, all in field order
+    """
+    results = list(field_results.values())
+    
+    def flags(key: str) -> np.ndarray:
+        return np.fromiter((bool(r.get(key)) for r in results), dtype=bool, count=len(results))
+        
+    return {
+        "fields": np.array(list(field_results), dtype=object),
+        "missing_gt": flags("missing_in_ground_truth"),
+        "missing_ext": flags("missing_in_extracted"),
+        "norm_match": flags("normalized_match"),
+    }
+
 
 class ResultsVisualizer(BaseVisualizer):
     """Visualizer for evaluation results and comparisons.
@@ -43,6 +193,22 @@ class ResultsVisualizer(BaseVisualizer):
         super().__init__(fig_size=fig_size, dpi=dpi, output_formats=output_formats)
         self._logger = logging.getLogger(__name__)
         
+    def _empty_figure(self, title: str) -> plt.Figure:
+        """Return a placeholder figure for results with nothing to plot.
+        
+        Args:
+            title: Title for the plot
+            
+        Returns:
+            Matplotlib Figure with a "no data" message
+        """
+        fig, ax = self.create_figure()
+        ax.text(0.5, 0.5, "No field results to display",
+                ha='center', va='center', fontsize=12)
+        ax.set_title(title)
+        ax.axis('off')
+        return fig
+        
     def visualize(self, data: Dict[str, Any]) -> plt.Figure:
         """Visualize evaluation results.
         
@@ -60,28 +226,31 @@ class ResultsVisualizer(BaseVisualizer):
             
     def visualize_field_results(
         self,
-        field_results: Dict[str, Dict[str, Any]],
+        field_results: Union[Dict[str, Dict[str, Any]], Dict[str, np.ndarray]],
         title: str = "Field Extraction Results"
     ) -> plt.Figure:
         """Visualize field-level extraction results.
         
         Args:
-            field_results: Dictionary mapping field names to result dictionaries
+            field_results: Dictionary mapping field names to result dictionaries,
+                or the equivalent arrays from field_result_arrays
             title: Title for the plot (default: "Field Extraction Results")
             
         Returns:
             Matplotlib Figure with field results visualization
         """
-        # Extract field accuracy data
-        accuracy_data = {}
-        for field, result in field_results.items():
-            # Skip fields missing in either ground truth or extracted
-            if result.get("missing_in_ground_truth") or result.get("missing_in_extracted"):
-                continue
-                
-            # Use normalized match if available, otherwise use exact match
-            accuracy_data[field] = 1.0 if result.get("normalized_match", False) else 0.0
+        if not isinstance(field_results.get("fields"), np.ndarray):
+            field_results = field_result_arrays(field_results)
             
+        # Skip fields missing in either ground truth or extracted, and score
+        # the rest by normalized match
+        keep = ~(field_results["missing_gt"] | field_results["missing_ext"])
+        if not keep.any():
+            return self._empty_figure(title)
+        fields = field_results["fields"][keep]
+        accuracy = field_results["norm_match"][keep].astype(np.float32)
+        accuracy_data = dict(zip(fields.tolist(), accuracy.tolist()))
+        
         # Use the utility function to create the visualization
         fig = plot_field_accuracy_bars(
             accuracy_data=accuracy_data,
@@ -118,14 +287,11 @@ class ResultsVisualizer(BaseVisualizer):
         
         # Create bar chart
         names, values = zip(*metrics)
+        values = np.asarray(values, dtype=np.float32)
         bars = ax.bar(names, values, color=["#3498db", "#2ecc71", "#e74c3c"])
         
         # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                   f"{height:.2f}",
-                   ha='center', va='bottom', fontsize=10)
+        ax.bar_label(bars, fmt="%.2f", padding=3, fontsize=10)
                    
         # Add a threshold line at 0.8
         ax.axhline(y=0.8, color='r', linestyle='--', alpha=0.7, 
@@ -159,39 +325,33 @@ class ResultsVisualizer(BaseVisualizer):
         
     def visualize_model_comparison(
         self,
-        model_results: Dict[str, Dict[str, float]],
+        model_results: Union[Dict[str, Dict[str, float]], ResultsTable],
         metric: str = "normalized_match_rate",
         title: str = "Model Comparison"
     ) -> plt.Figure:
         """Visualize comparison between different models.
         
         Args:
-            model_results: Dictionary mapping model names to result dictionaries
+            model_results: Dictionary mapping model names to result dictionaries,
+                or a ResultsTable built from one
             metric: Metric to compare (default: "normalized_match_rate")
             title: Title for the plot (default: "Model Comparison")
             
         Returns:
             Matplotlib Figure with model comparison
         """
-        # Extract the specified metric for each model
-        models = list(model_results.keys())
-        values = [results.get(metric, 0) for results in model_results.values()]
-        
-        # Sort by performance
-        sorted_indices = np.argsort(values)[::-1]  # Descending order
-        models = [models[i] for i in sorted_indices]
-        values = [values[i] for i in sorted_indices]
+        if not isinstance(model_results, ResultsTable):
+            model_results = ResultsTable.from_dict(model_results)
+            
+        # Extract the specified metric for each model, sorted by performance
+        models, values = model_results.sorted_by(metric)
         
         # Create bar chart
         fig, ax = self.create_figure()
-        bars = ax.bar(models, values, color=sns.color_palette("muted", len(models)))
+        bars = ax.bar(models, values, color=list(_muted_palette(len(models))))
         
         # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                   f"{height:.2f}",
-                   ha='center', va='bottom', fontsize=10)
+        ax.bar_label(bars, fmt="%.2f", padding=3, fontsize=10)
                    
         # Add a threshold line at 0.8
         ax.axhline(y=0.8, color='r', linestyle='--', alpha=0.7, 
@@ -204,7 +364,7 @@ class ResultsVisualizer(BaseVisualizer):
         ax.legend()
         
         # Format x-axis labels if they're too long
-        if max(len(model) for model in models) > 10:
+        if model_results.name_maxlen > 10:
             plt.xticks(rotation=45, ha='right')
             
         fig.tight_layout()
@@ -212,14 +372,15 @@ class ResultsVisualizer(BaseVisualizer):
         
     def visualize_prompt_comparison(
         self,
-        prompt_results: Dict[str, Dict[str, float]],
+        prompt_results: Union[Dict[str, Dict[str, float]], ResultsTable],
         metric: str = "normalized_match_rate",
         title: str = "Prompt Comparison"
     ) -> plt.Figure:
         """Visualize comparison between different prompt strategies.
         
         Args:
-            prompt_results: Dictionary mapping prompt names to result dictionaries
+            prompt_results: Dictionary mapping prompt names to result dictionaries,
+                or a ResultsTable built from one
             metric: Metric to compare (default: "normalized_match_rate")
             title: Title for the plot (default: "Prompt Comparison")
             
@@ -250,30 +411,31 @@ class ResultsVisualizer(BaseVisualizer):
         Returns:
             Matplotlib Figure with heatmap visualization
         """
-        # Extract model and prompt names
+        # Pivot into a models x prompts matrix; missing combinations score 0
         models = list(results_matrix.keys())
-        prompts = set()
-        for model_results in results_matrix.values():
-            prompts.update(model_results.keys())
-        prompts = sorted(list(prompts))
-        
-        # Create data matrix
-        data = np.zeros((len(models), len(prompts)))
-        for i, model in enumerate(models):
-            for j, prompt in enumerate(prompts):
-                data[i, j] = results_matrix[model].get(prompt, 0)
+        df = pd.DataFrame(results_matrix).reindex(columns=models).T
+        prompts = sorted(df.columns.tolist())
+        df = df.reindex(columns=prompts).fillna(0.0)
+        data = df.to_numpy(dtype=np.float32, copy=False)
                 
         # Create heatmap
         fig, ax = plt.subplots(figsize=self.fig_size, dpi=self.dpi)
-        sns.heatmap(
-            data,
-            annot=True,
-            fmt=".2f",
-            cmap="YlGnBu",
-            xticklabels=prompts,
-            yticklabels=models,
-            ax=ax
-        )
+        im = ax.imshow(data, cmap="YlGnBu", aspect="auto")
+        fig.colorbar(im, ax=ax)
+        ax.set_xticks(range(len(prompts)), prompts)
+        ax.set_yticks(range(len(models)), models)
+        ax.grid(False)
+        
+        # Annotate cells, with light text on dark cells as seaborn's heatmap does
+        if data.size <= _MAX_ANNOTATED_CELLS:
+            import seaborn as sns
+            
+            rgba = im.cmap(im.norm(data)).reshape(-1, 4)
+            luminance = np.reshape(sns.utils.relative_luminance(rgba), data.shape)
+            labels = np.char.mod("%.2f", data)
+            for (i, j), label in np.ndenumerate(labels):
+                ax.text(j, i, label, ha='center', va='center',
+                        color='w' if luminance[i, j] <= 0.408 else 'k')
         
         # Customize the chart
         ax.set_title(title)
@@ -281,10 +443,10 @@ class ResultsVisualizer(BaseVisualizer):
         ax.set_ylabel("Model")
         
         # Format labels if they're too long
-        if max(len(model) for model in models) > 10:
+        if _max_name_length(models) > 10:
             plt.yticks(rotation=0)
             
-        if max(len(prompt) for prompt in prompts) > 10:
+        if _max_name_length(prompts) > 10:
             plt.xticks(rotation=45, ha='right')
             
         fig.tight_layout()
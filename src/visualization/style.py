@@ -0,0 +1,22 @@
+"""Shared visualization style settings.
+
+This module holds the matplotlib style and output settings used by the
+visualizers and the visualization utility functions.
+"""
+
+# Default style sheet and rcParams overrides for all visualizations
+DEFAULT_STYLE = 'seaborn-v0_8-whitegrid'
+DEFAULT_RC = {
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
+    'axes.labelsize': 12,
+    'axes.titlesize': 14,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+    'figure.titlesize': 16,
+}
+
+# Pillow PNG encoder options: plot images are mostly flat colour, so a low
+# zlib level is much faster to write at a negligible size cost
+PNG_PIL_KWARGS = {'compress_level': 3, 'optimize': False}
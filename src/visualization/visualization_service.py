@@ -4,19 +4,21 @@ This module provides a service for coordinating visualization tasks
 across different types of data in the invoice extraction system.
 """
 
+import contextlib
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Generator, List, Optional, Set, Tuple, Union
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
 from PIL import Image
 import numpy as np
 
 from .base_visualizer import BaseVisualizer
 from .data_visualizer import DataVisualizer
 from .image_visualizer import ImageVisualizer
-from .results_visualizer import ResultsVisualizer
-from .visualization_utils import configure_matplotlib_defaults
+from .results_visualizer import ResultsTable, ResultsVisualizer
+from .visualization_utils import add_field_values_text, configure_matplotlib_defaults
 
 
 class VisualizationService:
@@ -52,6 +54,9 @@ class VisualizationService:
         self.output_dir = Path(output_dir) if output_dir else Path("./results/visualizations")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Output directories known to exist, so repeated saves skip mkdir
+        self._created_dirs: Set[Path] = {self.output_dir}
+        
         # Set up visualizers (with dependency injection)
         self.data_visualizer = data_visualizer or DataVisualizer()
         self.image_visualizer = image_visualizer or ImageVisualizer()
@@ -60,6 +65,10 @@ class VisualizationService:
         # Set up logging
         self._logger = logging.getLogger(__name__)
         
+        # Dashboard figure and panel artists kept by generate_summary_dashboard(reuse=True),
+        # released by close()
+        self._dashboard_cache: Optional[Tuple[plt.Figure, Dict[str, Any]]] = None
+        
         # Configure default matplotlib settings
         configure_matplotlib_defaults()
         
@@ -69,7 +78,8 @@ class VisualizationService:
         visualizer: BaseVisualizer,
         filename: str,
         subdirectory: Optional[str] = None,
-        formats: Optional[List[str]] = None
+        formats: Optional[List[str]] = None,
+        pdf_pages: Optional[PdfPages] = None
     ) -> List[Path]:
         """Visualize data and save to disk.
         
@@ -79,9 +89,12 @@ class VisualizationService:
             filename: Base filename (without extension)
             subdirectory: Optional subdirectory within output_dir
             formats: Output formats (default: from visualizer)
+            pdf_pages: Open multi-page PDF from batch_pdf; if given, the
+                figure is added to it as a page instead of being written
+                to its own PDF file
             
         Returns:
-            List of saved file paths
+            List of saved file paths (not including pages added to pdf_pages)
         """
         # Create figure using visualizer
         fig = visualizer.visualize(data)
@@ -90,12 +103,16 @@ class VisualizationService:
         output_path = self.output_dir
         if subdirectory:
             output_path = output_path / subdirectory
-            output_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(output_path)
             
         full_path = output_path / filename
         
-        # Save figure
-        saved_files = visualizer.save(fig, full_path, formats)
+        # Save figure, sending the PDF output to the batch document if there is one
+        formats = formats or visualizer.output_formats
+        if pdf_pages is not None and 'pdf' in formats:
+            pdf_pages.savefig(fig, bbox_inches='tight')
+            formats = [fmt for fmt in formats if fmt != 'pdf']
+        saved_files = visualizer.save(fig, full_path, formats) if formats else []
         
         # Close figure to free memory
         plt.close(fig)
@@ -103,6 +120,47 @@ class VisualizationService:
         self._logger.info(f"Saved visualization to {full_path}")
         return saved_files
         
+    @contextlib.contextmanager
+    def batch_pdf(
+        self,
+        filename: str,
+        subdirectory: Optional[str] = None
+    ) -> Generator[PdfPages, None, None]:
+        """Collect the PDF output of several visualizations into one document.
+        
+        Pass the yielded object as pdf_pages to visualize_and_save. Fonts
+        and other resources are then written once for the whole batch
+        rather than once per file.
+        
+        Args:
+            filename: Base filename (without extension)
+            subdirectory: Optional subdirectory within output_dir
+            
+        Yields:
+            Open PdfPages document, closed when the block exits
+        """
+        output_path = self.output_dir
+        if subdirectory:
+            output_path = output_path / subdirectory
+            self._ensure_dir(output_path)
+            
+        full_path = output_path / f"{filename}.pdf"
+        with PdfPages(full_path) as pdf_pages:
+            yield pdf_pages
+            page_count = pdf_pages.get_pagecount()
+            
+        self._logger.info(f"Saved {page_count} pages to {full_path}")
+        
+    def _ensure_dir(self, path: Path) -> None:
+        """Create an output directory unless this service already created it.
+        
+        Args:
+            path: Directory to create
+        """
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+            
     def visualize_ground_truth(
         self,
         ground_truth_data: pd.DataFrame,
@@ -202,7 +260,7 @@ class VisualizationService:
         output_path = self.output_dir
         if subdirectory:
             output_path = output_path / subdirectory
-            output_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(output_path)
             
         full_path = output_path / filename
         
@@ -217,7 +275,7 @@ class VisualizationService:
         
     def visualize_model_comparison(
         self,
-        model_results: Dict[str, Dict[str, float]],
+        model_results: Union[Dict[str, Dict[str, float]], ResultsTable],
         metric: str = "normalized_match_rate",
         filename: str = "model_comparison",
         subdirectory: str = "comparisons",
@@ -226,7 +284,8 @@ class VisualizationService:
         """Visualize a comparison between different models.
         
         Args:
-            model_results: Dictionary mapping model names to result dictionaries
+            model_results: Dictionary mapping model names to result dictionaries,
+                or a ResultsTable built from one
             metric: Metric to compare (default: "normalized_match_rate")
             filename: Base filename (default: "model_comparison")
             subdirectory: Output subdirectory (default: "comparisons")
@@ -235,6 +294,10 @@ class VisualizationService:
         Returns:
             List of saved file paths
         """
+        # Convert once so every metric view slices the same dense table
+        if not isinstance(model_results, ResultsTable):
+            model_results = ResultsTable.from_dict(model_results)
+            
         # Create visualization
         fig = self.results_visualizer.visualize_model_comparison(
             model_results=model_results,
@@ -246,7 +309,7 @@ class VisualizationService:
         output_path = self.output_dir
         if subdirectory:
             output_path = output_path / subdirectory
-            output_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(output_path)
             
         full_path = output_path / filename
         
@@ -262,103 +325,225 @@ class VisualizationService:
     def generate_summary_dashboard(
         self,
         ground_truth_data: pd.DataFrame,
-        model_results: Dict[str, Dict[str, float]],
+        model_results: Union[Dict[str, Dict[str, float]], ResultsTable],
         sample_image: Union[Image.Image, str, Path],
         sample_extraction: Dict[str, Any],
         filename: str = "dashboard",
         subdirectory: str = "",
-        formats: Optional[List[str]] = None
+        formats: Optional[List[str]] = None,
+        reuse: bool = False
     ) -> List[Path]:
         """Generate a comprehensive dashboard with multiple visualizations.
         
         Args:
             ground_truth_data: DataFrame with ground truth data
-            model_results: Dictionary mapping model names to result dictionaries
+            model_results: Dictionary mapping model names to result dictionaries,
+                or a ResultsTable built from one
             sample_image: Sample invoice image
             sample_extraction: Sample extraction results
             filename: Base filename (default: "dashboard")
             subdirectory: Output subdirectory (default: "")
             formats: Output formats (default: from visualizer)
+            reuse: Keep the dashboard figure open and update its artists in
+                place on the next reuse=True call instead of rebuilding it;
+                close() releases the kept figure (default: False)
             
         Returns:
             List of saved file paths
         """
+        if reuse and self._dashboard_cache is not None:
+            fig, panels = self._dashboard_cache
+            self._update_dashboard(
+                panels, ground_truth_data, model_results, sample_image, sample_extraction
+            )
+        else:
+            fig, panels = self._build_dashboard(
+                ground_truth_data, model_results, sample_image, sample_extraction
+            )
+            if reuse:
+                self._dashboard_cache = (fig, panels)
+                
+        fig.tight_layout()
+        
+        # Determine output path
+        output_path = self.output_dir
+        if subdirectory:
+            output_path = output_path / subdirectory
+            self._ensure_dir(output_path)
+            
+        full_path = output_path / filename
+        
+        # Save figure in each format
+        formats = formats or ['png', 'pdf']
+        saved_files = self.results_visualizer.save(fig, full_path, formats, dpi=150)
+            
+        # Close figure to free memory unless it is kept for the next update
+        if not reuse:
+            plt.close(fig)
+        else:
+            fig.canvas.draw_idle()
+        
+        self._logger.info(f"Saved dashboard to {full_path}")
+        return saved_files
+        
+    def close(self) -> None:
+        """Close the dashboard figure kept by generate_summary_dashboard(reuse=True).
+        
+        The next reuse=True call builds a new dashboard. Safe to call more
+        than once.
+        """
+        if self._dashboard_cache is not None:
+            plt.close(self._dashboard_cache[0])
+            self._dashboard_cache = None
+            
+    def __enter__(self) -> "VisualizationService":
+        """Enter a block that closes the kept dashboard figure on exit."""
+        return self
+        
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the kept dashboard figure."""
+        self.close()
+        
+    def _build_dashboard(
+        self,
+        ground_truth_data: pd.DataFrame,
+        model_results: Union[Dict[str, Dict[str, float]], ResultsTable],
+        sample_image: Union[Image.Image, str, Path],
+        sample_extraction: Dict[str, Any]
+    ) -> Tuple[plt.Figure, Dict[str, Any]]:
+        """Create the dashboard figure and its three panels.
+        
+        Args:
+            ground_truth_data: DataFrame with ground truth data
+            model_results: Model results, as dictionaries or a ResultsTable
+            sample_image: Sample invoice image
+            sample_extraction: Sample extraction results
+            
+        Returns:
+            Tuple of (Figure, panel artists used by _update_dashboard)
+        """
         # Create a multi-panel figure
         fig = plt.figure(figsize=(20, 16), dpi=150)
         
         # Create layout grid
         gs = fig.add_gridspec(2, 2)
+        panels: Dict[str, Any] = {
+            "missing_ax": fig.add_subplot(gs[0, 0]),
+            "models_ax": fig.add_subplot(gs[0, 1]),
+            "sample_ax": fig.add_subplot(gs[1, :]),
+        }
         
         # Panel 1: Data overview
-        ax1 = fig.add_subplot(gs[0, 0])
-        self.data_visualizer._plot_missing_values(ground_truth_data, ax1)
+        self.data_visualizer._plot_missing_values(ground_truth_data, panels["missing_ax"])
         
         # Panel 2: Model comparison
-        ax2 = fig.add_subplot(gs[0, 1])
-        self._plot_model_comparison(model_results, ax2)
+        panels["bars"], panels["bar_labels"], panels["bar_models"] = (
+            self._plot_model_comparison(model_results, panels["models_ax"])
+        )
         
         # Panel 3: Sample image with extraction
-        ax3 = fig.add_subplot(gs[1, :])
-        self._plot_sample_extraction(sample_image, sample_extraction, ax3)
+        self._plot_sample_extraction(sample_image, sample_extraction, panels["sample_ax"])
+        panels["image_source"] = sample_image
         
         # Add title
         fig.suptitle("Invoice Extraction Dashboard", fontsize=20)
-        fig.tight_layout()
+        return fig, panels
         
-        # Determine output path
-        output_path = self.output_dir
-        if subdirectory:
-            output_path = output_path / subdirectory
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-        full_path = output_path / filename
+    def _update_dashboard(
+        self,
+        panels: Dict[str, Any],
+        ground_truth_data: pd.DataFrame,
+        model_results: Union[Dict[str, Dict[str, float]], ResultsTable],
+        sample_image: Union[Image.Image, str, Path],
+        sample_extraction: Dict[str, Any]
+    ) -> None:
+        """Update a cached dashboard in place.
         
-        # Save figure
-        formats = formats or ['png', 'pdf']
-        saved_files = []
+        Bars are resized when the models keep their order, and the sample
+        image is kept when it is the same image; other parts are redrawn
+        on their existing axes.
         
-        for fmt in formats:
-            output_file = f"{full_path}.{fmt}"
-            fig.savefig(output_file, format=fmt, dpi=150, bbox_inches='tight')
-            saved_files.append(Path(output_file))
+        Args:
+            panels: Panel artists returned by _build_dashboard
+            ground_truth_data: DataFrame with ground truth data
+            model_results: Model results, as dictionaries or a ResultsTable
+            sample_image: Sample invoice image
+            sample_extraction: Sample extraction results
+        """
+        ax = panels["missing_ax"]
+        ax.cla()
+        self.data_visualizer._plot_missing_values(ground_truth_data, ax)
+        
+        table, models, values = self._sorted_metric(model_results, "normalized_match_rate")
+        if models == panels["bar_models"]:
+            for bar, label, value in zip(panels["bars"], panels["bar_labels"], values.tolist()):
+                bar.set_height(value)
+                label.xy = (label.xy[0], value)
+                label.set_text(f"{value:.2f}")
+        else:
+            ax = panels["models_ax"]
+            ax.cla()
+            panels["bars"], panels["bar_labels"], panels["bar_models"] = (
+                self._plot_model_comparison(table, ax)
+            )
             
-        # Close figure to free memory
-        plt.close(fig)
+        ax = panels["sample_ax"]
+        if sample_image is panels["image_source"] or (
+            isinstance(sample_image, (str, Path)) and sample_image == panels["image_source"]
+        ):
+            for text in list(ax.texts):
+                text.remove()
+            add_field_values_text(ax, sample_extraction)
+        else:
+            ax.cla()
+            self._plot_sample_extraction(sample_image, sample_extraction, ax)
+            panels["image_source"] = sample_image
+            
+    def _sorted_metric(
+        self,
+        model_results: Union[Dict[str, Dict[str, float]], ResultsTable],
+        metric: str
+    ) -> Tuple[ResultsTable, List[str], np.ndarray]:
+        """Order models by descending value of a metric.
         
-        self._logger.info(f"Saved dashboard to {full_path}")
-        return saved_files
+        Args:
+            model_results: Model results, as dictionaries or a ResultsTable
+            metric: Metric to sort by
+            
+        Returns:
+            Tuple of (results table, sorted model names, sorted values)
+        """
+        if not isinstance(model_results, ResultsTable):
+            model_results = ResultsTable.from_dict(model_results)
+            
+        models, values = model_results.sorted_by(metric)
+        return model_results, models.tolist(), values
         
     def _plot_model_comparison(
         self,
-        model_results: Dict[str, Dict[str, float]],
+        model_results: Union[Dict[str, Dict[str, float]], ResultsTable],
         ax: plt.Axes,
         metric: str = "normalized_match_rate"
-    ) -> None:
+    ) -> Tuple[Any, List[Any], List[str]]:
         """Helper method to plot model comparison on given axes.
         
         Args:
-            model_results: Dictionary mapping model names to result dictionaries
+            model_results: Dictionary mapping model names to result dictionaries,
+                or a ResultsTable built from one
             ax: Matplotlib axes to plot on
             metric: Metric to compare (default: "normalized_match_rate")
+            
+        Returns:
+            Tuple of (bar container, bar value labels, model names in bar order)
         """
-        # Extract the specified metric for each model
-        models = list(model_results.keys())
-        values = [results.get(metric, 0) for results in model_results.values()]
-        
-        # Sort by performance
-        sorted_indices = np.argsort(values)[::-1]  # Descending order
-        models = [models[i] for i in sorted_indices]
-        values = [values[i] for i in sorted_indices]
+        # Extract the specified metric for each model, sorted by performance
+        model_results, models, values = self._sorted_metric(model_results, metric)
         
         # Create bar chart
         bars = ax.bar(models, values, color=['#3498db', '#2ecc71', '#e74c3c'])
         
         # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                  f"{height:.2f}",
-                  ha='center', va='bottom', fontsize=10)
+        labels = ax.bar_label(bars, fmt="%.2f", padding=3, fontsize=10)
                   
         # Add a threshold line at 0.8
         ax.axhline(y=0.8, color='r', linestyle='--', alpha=0.7, 
@@ -370,9 +555,11 @@ class VisualizationService:
         ax.set_title("Model Comparison")
         
         # Format x-axis labels if they're too long
-        if max(len(model) for model in models) > 10:
+        if model_results.name_maxlen > 10:
             plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
             
+        return bars, labels, models
+            
     def _plot_sample_extraction(
         self,
         image: Union[Image.Image, str, Path],
@@ -399,27 +586,17 @@ class VisualizationService:
         else:
             img = image
             
+        # Downscale to twice the panel's pixel size so the Agg resampler
+        # does not process a full-resolution scan on every draw
+        target = (max(1, int(ax.bbox.width * 2)), max(1, int(ax.bbox.height * 2)))
+        if img.width > target[0] or img.height > target[1]:
+            img = img.copy()
+            img.thumbnail(target, Image.Resampling.LANCZOS)
+            
         # Display image
-        ax.imshow(img)
+        ax.imshow(img, interpolation='none')
         ax.set_title("Sample Extraction")
+        add_field_values_text(ax, extraction)
         
-        # Add extracted field values to the image
-        y_pos = 0.05
-        for field, value in extraction.items():
-            # Format the field-value text
-            text = f"{field}: {value}"
-            
-            # Add text with colored background
-            ax.text(
-                0.02, y_pos, 
-                text,
-                transform=ax.transAxes,
-                fontsize=10,
-                verticalalignment='bottom',
-                bbox=dict(facecolor='white', alpha=0.8, edgecolor='blue', pad=3)
-            )
-            
-            y_pos += 0.06  # Move down for next field
-            
         # Hide axes
         ax.axis('off')
@@ -3,31 +3,57 @@
 This module provides utility functions for visualizing data in the invoice extraction system.
 """
 
-import os
+import logging
 import numpy as np
-import pandas as pd
 import matplotlib
 # Set non-interactive backend to avoid Tkinter issues in testing environments
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-import seaborn as sns
+from matplotlib.collections import PatchCollection
+from matplotlib.image import pil_to_array
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from PIL import Image
 
+from .style import DEFAULT_RC, DEFAULT_STYLE, PNG_PIL_KWARGS
+
+logger = logging.getLogger(__name__)
+
+# Style sheet most recently applied through _use_style
+_CURRENT_STYLE: Optional[str] = None
+
+# Set once configure_matplotlib_defaults has run in this process
+_DEFAULTS_APPLIED = False
+
+def _use_style(style: str) -> None:
+    """Apply a matplotlib style sheet unless it was the last one applied here.
+    
+    Style sheets are parsed and written into the global rcParams on every
+    plt.style.use call, so repeated figures with the same style skip it.
+    Styles applied with plt.style.use directly are not tracked.
+    
+    Args:
+        style: Matplotlib style to use
+    """
+    global _CURRENT_STYLE
+    if _CURRENT_STYLE != style:
+        plt.style.use(style)
+        _CURRENT_STYLE = style
+
 
 def configure_matplotlib_defaults() -> None:
-    """Configure default matplotlib style settings for consistent visualizations."""
-    plt.style.use('seaborn-v0_8-whitegrid')
-    plt.rcParams['font.family'] = 'sans-serif'
-    plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
-    plt.rcParams['axes.labelsize'] = 12
-    plt.rcParams['axes.titlesize'] = 14
-    plt.rcParams['xtick.labelsize'] = 10
-    plt.rcParams['ytick.labelsize'] = 10
-    plt.rcParams['legend.fontsize'] = 10
-    plt.rcParams['figure.titlesize'] = 16
+    """Configure default matplotlib style settings for consistent visualizations.
+    
+    The settings are global, so they are applied once per process; later
+    calls are no-ops.
+    """
+    global _DEFAULTS_APPLIED
+    if _DEFAULTS_APPLIED:
+        return
+    _use_style(DEFAULT_STYLE)
+    plt.rcParams.update(DEFAULT_RC)
+    _DEFAULTS_APPLIED = True
 
 
 def create_figure(
@@ -45,7 +71,7 @@ def create_figure(
     Returns:
         Tuple of (Figure, Axes)
     """
-    plt.style.use(style)
+    _use_style(style)
     fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
     return fig, ax
 
@@ -54,7 +80,8 @@ def save_figure(
     fig: plt.Figure,
     filename: Union[str, Path],
     formats: Optional[List[str]] = None,
-    dpi: int = 100
+    dpi: int = 100,
+    pad_inches: Optional[Union[float, str]] = None
 ) -> List[Path]:
     """Save a figure to disk in specified formats.
     
@@ -63,24 +90,66 @@ def save_figure(
         filename: Base filename (without extension)
         formats: List of formats to save as (default: ['png', 'pdf'])
         dpi: Dots per inch (default: 100)
+        pad_inches: Padding around the tight bounding box in inches, or
+            'layout' to use the layout engine's padding
+            (default: rcParams['savefig.pad_inches'])
         
     Returns:
         List of paths to saved files
     """
     formats = formats or ['png', 'pdf']
-    saved_files = []
     
+    # Compute the tight bounding box once instead of once per format. Figures
+    # without a renderer-backed canvas, and 'layout' padding, which savefig
+    # resolves itself, use the regular per-save tight bbox instead.
+    bbox: Any = 'tight'
+    if pad_inches is None:
+        pad_inches = plt.rcParams['savefig.pad_inches']
+    if hasattr(fig.canvas, 'get_renderer') and pad_inches != 'layout':
+        fig.canvas.draw()
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+        
+    saved_files = []
     for fmt in formats:
         output_path = Path(f"{filename}.{fmt}")
+        extra_kwargs = {'pil_kwargs': dict(PNG_PIL_KWARGS)} if fmt == 'png' else {}
         try:
-            fig.savefig(output_path, format=fmt, dpi=dpi, bbox_inches='tight')
+            fig.savefig(
+                output_path, format=fmt, dpi=dpi,
+                bbox_inches=bbox, pad_inches=pad_inches, **extra_kwargs
+            )
             saved_files.append(output_path)
+            logger.debug(f"Saved figure to {output_path}")
         except Exception as e:
-            print(f"Failed to save figure as {fmt}: {str(e)}")
+            logger.error(f"Failed to save figure as {fmt}: {str(e)}")
             
     return saved_files
 
 
+def add_field_values_text(ax: plt.Axes, fields: Dict[str, Any]) -> None:
+    """Overlay field values on an image axes as one text block.
+    
+    Lines are stacked upward from the bottom-left corner, so the first
+    field is the lowest line. Nothing is drawn for empty fields.
+    
+    Args:
+        ax: Matplotlib axes showing the image
+        fields: Dictionary mapping field names to values
+    """
+    if not fields:
+        return
+        
+    lines = [f"{field}: {value}" for field, value in fields.items()]
+    ax.text(
+        0.02, 0.05, 
+        "\n".join(reversed(lines)),
+        transform=ax.transAxes,
+        fontsize=10,
+        verticalalignment='bottom',
+        bbox=dict(facecolor='white', alpha=0.8, edgecolor='blue', pad=3)
+    )
+
+
 def plot_confusion_matrix(
     confusion_matrix: np.ndarray,
     class_names: Optional[List[str]] = None,
@@ -100,19 +169,37 @@ def plot_confusion_matrix(
     Returns:
         Matplotlib Figure with confusion matrix visualization
     """
+    import seaborn as sns
+
     if normalize:
-        confusion_matrix = confusion_matrix.astype('float') / confusion_matrix.sum(axis=1)[:, np.newaxis]
+        # Normalize rows in place on one float32 copy, scaling each row by
+        # its reciprocal sum (one divide per row); all-zero rows stay zero
+        cm = confusion_matrix.astype(np.float32, copy=True)
+        row_sums = cm.sum(axis=1, keepdims=True)
+        inv_sums = np.zeros_like(row_sums)
+        np.divide(1.0, row_sums, out=inv_sums, where=row_sums > 0)
+        cm *= inv_sums
+        confusion_matrix = cm
         
+    # Format all cell labels in one vectorized call rather than per cell in seaborn
+    if normalize:
+        annot = np.char.mod('%.2f', confusion_matrix)
+    else:
+        annot = np.char.mod('%d', np.asarray(confusion_matrix, dtype=np.int64))
+        
+    # Let seaborn number the classes when no names are given
+    tick_labels = class_names if class_names is not None else 'auto'
+    
     fig, ax = plt.subplots(figsize=(8, 6))
     sns.heatmap(
         confusion_matrix,
-        annot=True,
-        fmt='.2f' if normalize else 'd',
+        annot=annot,
+        fmt='',
         cmap=cmap,
         cbar=True,
         square=True,
-        xticklabels=class_names,
-        yticklabels=class_names,
+        xticklabels=tick_labels,
+        yticklabels=tick_labels,
         ax=ax
     )
     
@@ -141,13 +228,13 @@ def plot_field_accuracy_bars(
     Returns:
         Matplotlib Figure with bar chart
     """
-    fields = list(accuracy_data.keys())
-    values = list(accuracy_data.values())
+    fields = np.array(list(accuracy_data), dtype=object)
+    values = np.fromiter(accuracy_data.values(), dtype=np.float64, count=len(accuracy_data))
     
     # Sort by accuracy value
     sorted_indices = np.argsort(values)
-    fields = [fields[i] for i in sorted_indices]
-    values = [values[i] for i in sorted_indices]
+    fields = fields[sorted_indices]
+    values = values[sorted_indices]
     
     fig, ax = plt.subplots(figsize=(10, max(6, len(fields) * 0.4)))
     
@@ -160,8 +247,7 @@ def plot_field_accuracy_bars(
         ax.legend()
     
     # Add values at the end of each bar
-    for i, v in enumerate(values):
-        ax.text(v + 0.01, i, f'{v:.1%}', va='center')
+    ax.bar_label(bars, labels=np.char.mod('%.1f%%', values * 100).tolist(), padding=3)
     
     # Labels and title
     ax.set_xlabel('Accuracy')
@@ -172,6 +258,57 @@ def plot_field_accuracy_bars(
     return fig
 
 
+def _image_to_array(img: Image.Image) -> np.ndarray:
+    """Convert a PIL Image to the pixel array imshow would display.
+    
+    RGB, RGBA and greyscale images are exposed through the array interface
+    without going through matplotlib's conversion; other modes (palette,
+    16-bit, ...) are converted by matplotlib.
+    
+    Args:
+        img: Image to convert
+        
+    Returns:
+        Pixel array
+    """
+    if img.mode in ('RGB', 'RGBA', 'L'):
+        return np.asarray(img)
+    return pil_to_array(img)
+
+
+def split_annotations(
+    annotations: Dict[str, Union[Tuple[int, int, int, int], List[Tuple[int, int]]]]
+) -> Tuple[Dict[str, Tuple[int, int, int, int]], Dict[str, np.ndarray]]:
+    """Sort annotations into bounding boxes and point arrays in one pass.
+    
+    Point lists are validated while they are copied into their array.
+    Entries that are neither a 4-tuple box nor a non-empty list of (x, y)
+    points are dropped.
+    
+    Args:
+        annotations: Dictionary mapping field names to bounding boxes
+            (x, y, width, height) or point coordinates [(x1, y1), ...]
+            
+    Returns:
+        Tuple of (boxes by field name, float32 (n, 2) point arrays by field name)
+    """
+    boxes = {}
+    polylines = {}
+    for field_name, coords in annotations.items():
+        match coords:
+            case tuple((_, _, _, _)):
+                boxes[field_name] = coords
+            case list([_, *_]):
+                try:
+                    polylines[field_name] = np.fromiter(
+                        (c for point in coords if len(point) == 2 for c in point),
+                        dtype=np.float32, count=2 * len(coords)
+                    ).reshape(-1, 2)
+                except (TypeError, ValueError):
+                    continue
+    return boxes, polylines
+
+
 def plot_image_with_annotations(
     image: Union[str, Path, Image.Image, np.ndarray],
     annotations: Dict[str, Union[Tuple[int, int, int, int], List[Tuple[int, int]]]],
@@ -196,51 +333,47 @@ def plot_image_with_annotations(
     Returns:
         Matplotlib Figure with annotated image
     """
-    # Load image if it's a path
+    # Resolve the image to a pixel array once; arrays are used as given
     if isinstance(image, (str, Path)):
-        img = Image.open(image)
+        with Image.open(image) as img:
+            img.load()
+            pixels = _image_to_array(img)
     elif isinstance(image, np.ndarray):
-        img = Image.fromarray(image)
+        pixels = image
     elif isinstance(image, Image.Image):
-        img = image
+        pixels = _image_to_array(image)
     else:
         raise ValueError("Image must be a PIL Image, numpy array, or path to image file")
     
     # Create figure and display image
     fig, ax = plt.subplots(figsize=figsize)
-    ax.imshow(img)
+    ax.imshow(pixels, interpolation='none')
     ax.set_title(title)
     
-    # Add annotations
-    for field_name, coords in annotations.items():
-        if isinstance(coords, tuple) and len(coords) == 4:
-            # Bounding box (x, y, width, height)
-            x, y, width, height = coords
-            rect = patches.Rectangle(
-                (x, y), width, height, 
-                linewidth=2, edgecolor=box_color, facecolor='none', alpha=0.7
-            )
-            ax.add_patch(rect)
-            
-            # Add field name label
-            ax.text(
-                x, y - 5, field_name, 
-                color=box_color, fontsize=font_size, 
-                bbox=dict(facecolor='white', alpha=0.7, edgecolor='none')
-            )
-            
-        elif isinstance(coords, list) and all(isinstance(p, tuple) and len(p) == 2 for p in coords):
-            # Polygon or points [(x1, y1), (x2, y2), ...]
-            points = np.array(coords)
-            ax.plot(points[:, 0], points[:, 1], 'o-', color=box_color, linewidth=2, alpha=0.7)
-            
-            # Add field name label at the first point
-            if len(coords) > 0:
-                ax.text(
-                    coords[0][0], coords[0][1] - 5, field_name, 
-                    color=box_color, fontsize=font_size, 
-                    bbox=dict(facecolor='white', alpha=0.7, edgecolor='none')
-                )
+    # Add annotations; boxes are drawn as one patch collection and point
+    # lists as one NaN-separated line, so each kind is one artist
+    boxes, polylines = split_annotations(annotations)
+    if boxes:
+        ax.add_collection(PatchCollection(
+            [patches.Rectangle((x, y), width, height) for x, y, width, height in boxes.values()],
+            linewidth=2, edgecolor=box_color, facecolor='none', alpha=0.7
+        ))
+    if polylines:
+        separator = np.full((1, 2), np.nan, dtype=np.float32)
+        points = np.concatenate([
+            part for line in polylines.values() for part in (line, separator)
+        ])
+        ax.plot(points[:, 0], points[:, 1], 'o-', color=box_color, linewidth=2, alpha=0.7)
+        
+    # Add field name labels above each box or at the first point
+    label_positions = [(name, box[0], box[1]) for name, box in boxes.items()]
+    label_positions += [(name, line[0, 0], line[0, 1]) for name, line in polylines.items()]
+    for field_name, x, y in label_positions:
+        ax.text(
+            x, y - 5, field_name, 
+            color=box_color, fontsize=font_size, 
+            bbox=dict(facecolor='white', alpha=0.7, edgecolor='none')
+        )
     
     # Hide axes
     ax.axis('off')
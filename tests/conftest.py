@@ -9,14 +9,16 @@ def temp_config_dir():
     """Create a temporary directory with test config files."""
     temp_dir = tempfile.mkdtemp()
     
-    # Copy test fixtures to temp directory
+    # Link test fixtures into temp directory (tests only read them);
+    # copy instead where hard links are not possible
     fixture_dir = Path(__file__).parent / "fixtures" / "config"
-    for root, _, files in os.walk(fixture_dir):
-        for file in files:
-            if file.endswith('.yaml'):
-                src = os.path.join(root, file)
-                dst = os.path.join(temp_dir, file)
-                shutil.copy2(src, dst)
+    temp_path = Path(temp_dir)
+    for src in fixture_dir.rglob('*.yaml'):
+        dst = temp_path / src.name
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
     
     yield temp_dir
     shutil.rmtree(temp_dir)
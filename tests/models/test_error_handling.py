@@ -3,15 +3,14 @@ Tests for model error handling.
 
 This module tests the error handling components for model loading and inference.
 """
-import os
-import tempfile
+import threading
 import time
-import unittest
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Any, Dict, Optional
 from unittest import mock
 
+import pytest
 from PIL import Image
 
 from src.config.base_config import BaseConfig
@@ -26,9 +25,15 @@ from src.models.model_errors import (
     ModelResourceError,
     ModelTimeoutError
 )
-from src.models.model_loading_timeout import TimeoutHandler, load_model_with_timeout
+from src.models.model_loading_timeout import load_model_with_timeout
 from src.models.retry_utils import RetryConfig, with_retry
 
+# A valid 1x1 white RGB PNG; tests only need a readable image file
+_TINY_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010802000000907753de"
+    "0000000c4944415478da63f8ffff3f0005fe02fe331295140000000049454e44ae426082"
+)
+
 
 class MockConfig(BaseConfig):
     """Mock configuration class for testing."""
@@ -55,14 +60,82 @@ class MockConfig(BaseConfig):
         return True
 
 
+class FakeClock:
+    """Clock that advances instantly instead of blocking.
+    
+    Provides the subset of the time module used by the code under test, so
+    it can be patched in for a module's ``time`` or injected into a model.
+    """
+    
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self.sleeps = []
+        
+    def now(self) -> float:
+        """Return the current fake time in seconds."""
+        return self._now
+        
+    time = now
+    monotonic = now
+    
+    def sleep(self, seconds: float) -> None:
+        """Advance the fake time without blocking."""
+        self.sleeps.append(seconds)
+        self._now += seconds
+
+
+def load_with_fake_clock(clock: FakeClock):
+    """Build a load_model_with_timeout replacement driven by a fake clock.
+    
+    The loader runs inline and times out when it advanced the clock past
+    the limit, so timeout paths are exercised without real waiting.
+    """
+    def loader(loader_func, timeout_seconds, model_name=None, component=None,
+               resource_name=None):
+        start = clock.now()
+        result = loader_func()
+        elapsed = clock.now() - start
+        if elapsed > timeout_seconds:
+            raise ModelLoaderTimeoutError(
+                "Model loading operation exceeded time limit",
+                model_name=model_name,
+                component=component,
+                resource_name=resource_name,
+                timeout_seconds=elapsed
+            )
+        return result
+    return loader
+
+
+def _counting_fn(
+    counter: Dict[str, int],
+    fail_until: Optional[float] = None,
+    exc: type = ValueError
+) -> str:
+    """Count a call and fail until the count reaches fail_until."""
+    counter["count"] += 1
+    if fail_until is not None and counter["count"] < fail_until:
+        raise exc("Test error")
+    return "success"
+
+
 class SlowTestModel(BaseModelImpl):
     """Test model that simulates slow loading and processing."""
     
+    def __init__(self, clock: Optional[Any] = None):
+        """Initialize the test model.
+        
+        Args:
+            clock: Object providing sleep() for simulated delays (default: time)
+        """
+        super().__init__()
+        self._clock = clock or time
+        
     def _initialize_impl(self, config: BaseConfig) -> None:
         """Simulate slow initialization."""
         delay = config.get_value("init_delay", 0)
         if delay > 0:
-            time.sleep(delay)
+            self._clock.sleep(delay)
             
         error_type = config.get_value("init_error", None)
         if error_type == "resource":
@@ -74,7 +147,7 @@ class SlowTestModel(BaseModelImpl):
         """Simulate slow processing."""
         delay = self._config.get_value("process_delay", 0)
         if delay > 0:
-            time.sleep(delay)
+            self._clock.sleep(delay)
             
         error_type = self._config.get_value("process_error", None)
         if error_type == "processing":
@@ -91,96 +164,101 @@ class SlowTestModel(BaseModelImpl):
         return True
 
 
-class TestRetryUtils(unittest.TestCase):
+class TestRetryUtils:
     """Test the retry utilities."""
     
+    @pytest.fixture(autouse=True)
+    def clock(self):
+        """Record retry backoff on a fake clock instead of sleeping."""
+        clock = FakeClock()
+        with mock.patch("src.models.retry_utils.time", clock):
+            yield clock
+    
     def test_retry_success_first_attempt(self):
         """Test successful function execution on first attempt."""
         counter = {"count": 0}
+        test_func = with_retry()(lambda: _counting_fn(counter))
         
-        @with_retry()
-        def test_func():
-            counter["count"] += 1
-            return "success"
-            
         result = test_func()
-        self.assertEqual(result, "success")
-        self.assertEqual(counter["count"], 1)
+        assert result == "success"
+        assert counter["count"] == 1
     
-    def test_retry_success_after_retries(self):
+    def test_retry_success_after_retries(self, clock):
         """Test successful function execution after retries."""
         counter = {"count": 0}
+        test_func = with_retry(RetryConfig(max_attempts=3, delay_seconds=0.1))(
+            lambda: _counting_fn(counter, fail_until=3)
+        )
         
-        @with_retry(RetryConfig(max_attempts=3, delay_seconds=0.1))
-        def test_func():
-            counter["count"] += 1
-            if counter["count"] < 3:
-                raise ValueError("Test error")
-            return "success"
-            
         result = test_func()
-        self.assertEqual(result, "success")
-        self.assertEqual(counter["count"], 3)
+        assert result == "success"
+        assert counter["count"] == 3
+        assert clock.sleeps == [0.1]
     
-    def test_retry_max_attempts_exceeded(self):
+    def test_retry_max_attempts_exceeded(self, clock):
         """Test max retry attempts exceeded."""
         counter = {"count": 0}
+        test_func = with_retry(RetryConfig(max_attempts=3, delay_seconds=0.1))(
+            lambda: _counting_fn(counter, fail_until=float("inf"))
+        )
         
-        @with_retry(RetryConfig(max_attempts=3, delay_seconds=0.1))
+        with pytest.raises(ValueError):
+            test_func()
+            
+        assert counter["count"] == 3
+        assert clock.sleeps == [0.1]
+    
+    def test_retry_backoff_schedule(self, clock):
+        """Test that retry delays grow by the backoff factor up to the cap."""
+        @with_retry(RetryConfig(
+            max_attempts=6,
+            delay_seconds=0.1,
+            backoff_factor=2.0,
+            max_delay_seconds=0.5
+        ))
         def test_func():
-            counter["count"] += 1
             raise ValueError("Test error")
             
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             test_func()
             
-        self.assertEqual(counter["count"], 3)
+        # The first retry follows immediately; later ones back off
+        assert clock.sleeps == [0.1, 0.2, 0.4, 0.5]
     
-    def test_retry_non_retryable_exception(self):
+    def test_retry_non_retryable_exception(self, clock):
         """Test non-retryable exception not retried."""
         counter = {"count": 0}
-        
-        @with_retry(RetryConfig(
+        test_func = with_retry(RetryConfig(
             max_attempts=3, 
             delay_seconds=0.1,
             non_retryable_exceptions=[KeyError]
-        ))
-        def test_func():
-            counter["count"] += 1
-            raise KeyError("Test error")
-            
-        with self.assertRaises(KeyError):
+        ))(lambda: _counting_fn(counter, fail_until=float("inf"), exc=KeyError))
+        
+        with pytest.raises(KeyError):
             test_func()
             
-        self.assertEqual(counter["count"], 1)
+        assert counter["count"] == 1
+        assert clock.sleeps == []
 
 
-class TestErrorRecovery(unittest.TestCase):
+class TestErrorRecovery:
     """Test the error recovery utilities."""
     
     def test_recovery_actions_executed(self):
         """Test that recovery actions are executed when an error occurs."""
-        action1_called = False
-        action2_called = False
+        action1 = mock.Mock()
+        action2 = mock.Mock()
         
-        def action1():
-            nonlocal action1_called
-            action1_called = True
-            
-        def action2():
-            nonlocal action2_called
-            action2_called = True
-            
         recovery_manager = ErrorRecoveryManager()
         recovery_manager.register_recovery_action(action1)
         recovery_manager.register_recovery_action(action2)
         
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             with recovery_manager.recovery_context("test"):
                 raise ValueError("Test error")
                 
-        self.assertTrue(action1_called)
-        self.assertTrue(action2_called)
+        action1.assert_called_once_with()
+        action2.assert_called_once_with()
     
     def test_error_recovery_decorator(self):
         """Test the error recovery decorator."""
@@ -202,30 +280,26 @@ class TestErrorRecovery(unittest.TestCase):
                 raise ValueError("Test error")
         
         # Verify the error is raised and propagated
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             test_func()
             
         # Now check if the recovery action was called
-        self.assertTrue(recovery_executed[0], "Recovery action was not executed")
+        assert recovery_executed[0], "Recovery action was not executed"
 
 
-class TestModelLoadingTimeout(unittest.TestCase):
+class TestModelLoadingTimeout:
     """Test the model loading timeout utilities."""
     
-    def test_timeout_handler(self):
-        """Test the timeout handler using a direct approach."""
-        # Create a simple function that should timeout
-        def function_that_sleeps():
-            time.sleep(1.0)  # Sleep for 1 second
-            return "completed"
+    def test_load_model_with_timeout_expires(self):
+        """Test that a loader still running after the timeout raises with model context."""
+        # The loader blocks briefly on an event that is never set, so the
+        # executor can shut down soon after the timeout fires
+        blocked = threading.Event()
         
-        # Create a ThreadPoolExecutor with short timeout
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(function_that_sleeps)
+        with pytest.raises(ModelLoaderTimeoutError) as exc_info:
+            load_model_with_timeout(lambda: blocked.wait(0.2), 0.01, model_name="slow_model")
             
-            # This should timeout before the function completes
-            with self.assertRaises(Exception):  # Can be TimeoutError or FutureTimeoutError
-                future.result(timeout=0.1)  # 0.1 second timeout
+        assert exc_info.value.model_name == "slow_model"
     
     def test_load_model_with_timeout_success(self):
         """Test successful model loading with timeout."""
@@ -233,175 +307,118 @@ class TestModelLoadingTimeout(unittest.TestCase):
             return "model"
             
         result = load_model_with_timeout(quick_loader, 1.0)
-        self.assertEqual(result, "model")
+        assert result == "model"
     
     def test_load_model_with_timeout_failure(self):
         """Test model loading timeout."""
-        def slow_loader():
-            time.sleep(0.3)  # Sleep long enough to trigger timeout
-            return "model"
+        slow_loader = mock.Mock(return_value="model")
+        
+        # Stub the executor so waiting for the result times out immediately
+        with mock.patch("src.models.model_loading_timeout.ThreadPoolExecutor") as executor_cls:
+            executor = executor_cls.return_value.__enter__.return_value
+            executor.submit.return_value.result.side_effect = FutureTimeoutError
             
-        with self.assertRaises(ModelLoaderTimeoutError):
-            load_model_with_timeout(slow_loader, 0.1)
+            with pytest.raises(ModelLoaderTimeoutError):
+                load_model_with_timeout(slow_loader, 0.1)
+                
+        executor.submit.assert_called_once_with(slow_loader)
 
 
-class TestModelErrorHandling(unittest.TestCase):
+@pytest.fixture(scope="module")
+def temp_image_path(tmp_path_factory):
+    """Create the temporary image shared by all tests; none modify it."""
+    path = tmp_path_factory.mktemp("images") / "test_image.png"
+    path.write_bytes(_TINY_PNG)
+    return path
+
+
+class TestModelErrorHandling:
     """Test the model error handling in BaseModelImpl."""
     
-    def setUp(self):
-        """Set up test resources."""
-        # Create a temporary image for testing
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_image_path = Path(self.temp_dir.name) / "test_image.png"
-        
-        # Create a simple test image
-        test_image = Image.new('RGB', (100, 100), color='white')
-        test_image.save(self.temp_image_path)
+    # Settings shared by every test configuration
+    _BASE = {"name": "test_model", "type": "slow_test", "version": "1.0"}
     
-    def tearDown(self):
-        """Clean up test resources."""
-        self.temp_dir.cleanup()
+    @pytest.fixture(autouse=True)
+    def clock(self):
+        """Drive delays, timeouts and retry backoff from a fake clock."""
+        clock = FakeClock()
+        with mock.patch(
+            "src.models.base_model_impl.load_model_with_timeout", load_with_fake_clock(clock)
+        ), mock.patch("src.models.retry_utils.time", clock):
+            yield clock
     
-    def test_model_initialization_timeout(self):
-        """Test model initialization timeout."""
-        model = SlowTestModel()
-        config = MockConfig({
-            "name": "test_model",
-            "type": "slow_test",
-            "version": "1.0",
-            "init_delay": 0.3,  # Delay longer than timeout
-            "loading_timeout_seconds": 0.1
-        })
-        
-        with self.assertRaises(ModelLoaderTimeoutError):
-            model.initialize(config)
+    def _config(self, **overrides: Any) -> MockConfig:
+        """Build a test configuration from the shared base settings."""
+        return MockConfig({**self._BASE, **overrides})
     
-    def test_model_initialization_error(self):
-        """Test model initialization error."""
-        model = SlowTestModel()
-        config = MockConfig({
-            "name": "test_model",
-            "type": "slow_test",
-            "version": "1.0",
-            "init_error": "initialization"
-        })
-        
-        with self.assertRaises(ModelInitializationError):
-            model.initialize(config)
-    
-    def test_model_resource_error(self):
-        """Test model resource error."""
-        model = SlowTestModel()
-        config = MockConfig({
-            "name": "test_model",
-            "type": "slow_test",
-            "version": "1.0",
-            "init_error": "resource"
-        })
+    def test_model_initialization_timeout(self, clock):
+        """Test model initialization timeout."""
+        model = SlowTestModel(clock)
+        config = self._config(
+            init_delay=300,  # Fake delay longer than timeout
+            loading_timeout_seconds=0.1
+        )
         
-        with self.assertRaises(ModelResourceError):
+        with pytest.raises(ModelLoaderTimeoutError):
             model.initialize(config)
     
-    def test_model_config_error(self):
-        """Test model configuration error."""
-        model = SlowTestModel()
-        config = MockConfig({
-            "name": "test_model",
-            "type": "slow_test",
-            "version": "1.0",
-            "config_error": True
-        })
+    @pytest.mark.parametrize("overrides,expected_error", [
+        ({"init_error": "initialization"}, ModelInitializationError),
+        ({"init_error": "resource"}, ModelResourceError),
+        ({"config_error": True}, ModelConfigError),
+    ])
+    def test_model_initialization_errors(self, clock, overrides, expected_error):
+        """Test errors raised while initializing the model."""
+        model = SlowTestModel(clock)
         
-        with self.assertRaises(ModelConfigError):
-            model.initialize(config)
+        with pytest.raises(expected_error):
+            model.initialize(self._config(**overrides))
     
-    def test_model_processing_timeout(self):
+    def test_model_processing_timeout(self, clock, temp_image_path):
         """Test model processing timeout."""
         # Create and initialize model
-        model = SlowTestModel()
-        model.initialize(MockConfig({
-            "name": "test_model",
-            "type": "slow_test",
-            "version": "1.0",
-        }))
-        
-        # Mock _process_image_with_timeout to raise TimeoutError
-        original_process = model._process_image_with_timeout
+        model = SlowTestModel(clock)
+        model.initialize(self._config())
         
-        def mock_process(*args, **kwargs):
-            raise TimeoutError("Test timeout")
-            
-        # Apply mock and test
-        model._process_image_with_timeout = mock_process
-        
-        with self.assertRaises(ModelTimeoutError):
-            model.process_image(self.temp_image_path)
-            
-        # Restore original method
-        model._process_image_with_timeout = original_process
+        # Make the timed processing step raise a bare TimeoutError
+        with mock.patch.object(
+            model, "_process_image_with_timeout", side_effect=TimeoutError("Test timeout")
+        ):
+            with pytest.raises(ModelTimeoutError):
+                model.process_image(temp_image_path)
     
-    def test_model_processing_error(self):
-        """Test model processing error."""
-        # Create and initialize model
-        model = SlowTestModel()
-        config = MockConfig({
-            "name": "test_model",
-            "type": "slow_test",
-            "version": "1.0",
-            "process_error": "processing"
-        })
-        model.initialize(config)
+    @pytest.mark.parametrize("process_error,expected_error", [
+        ("processing", ModelProcessingError),
+        ("input", ModelInputError),
+    ])
+    def test_model_processing_errors(self, clock, temp_image_path, process_error, expected_error):
+        """Test errors raised while processing an image."""
+        model = SlowTestModel(clock)
+        model.initialize(self._config(process_error=process_error))
         
-        with self.assertRaises(ModelProcessingError):
-            model.process_image(self.temp_image_path)
+        with pytest.raises(expected_error):
+            model.process_image(temp_image_path)
     
-    def test_model_input_error(self):
-        """Test model input error."""
-        # Create and initialize model
-        model = SlowTestModel()
-        config = MockConfig({
-            "name": "test_model",
-            "type": "slow_test",
-            "version": "1.0",
-            "process_error": "input"
-        })
-        model.initialize(config)
-        
-        with self.assertRaises(ModelInputError):
-            model.process_image(self.temp_image_path)
-    
-    def test_file_not_found_error(self):
+    def test_file_not_found_error(self, clock, temp_image_path):
         """Test file not found error."""
         # Create and initialize model
-        model = SlowTestModel()
-        config = MockConfig({
-            "name": "test_model",
-            "type": "slow_test",
-            "version": "1.0"
-        })
+        model = SlowTestModel(clock)
+        config = self._config()
         model.initialize(config)
         
         # Use a non-existent file path
-        non_existent_path = Path(self.temp_dir.name) / "non_existent.png"
+        non_existent_path = temp_image_path.with_name("non_existent.png")
         
-        with self.assertRaises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError):
             model.process_image(non_existent_path)
     
-    def test_successful_processing(self):
+    def test_successful_processing(self, clock, temp_image_path):
         """Test successful model processing."""
         # Create and initialize model
-        model = SlowTestModel()
-        config = MockConfig({
-            "name": "test_model",
-            "type": "slow_test",
-            "version": "1.0"
-        })
+        model = SlowTestModel(clock)
+        config = self._config()
         model.initialize(config)
         
         # Process image
-        result = model.process_image(self.temp_image_path)
-        self.assertEqual(result, {"result": "success"})
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+        result = model.process_image(temp_image_path)
+        assert result == {"result": "success"}
@@ -5,8 +5,9 @@ This module tests the model factory to ensure proper model
 registration, initialization, and error handling.
 """
 import pytest
+from functools import partial
 from unittest.mock import MagicMock, patch
-from typing import Dict, Any
+from typing import Dict, Any, Type
 
 from src.models.model_factory import ModelFactory
 from src.models.base_model import BaseModel
@@ -59,11 +60,17 @@ class MockConfig(BaseConfig):
 
 # Mock model implementation for testing
 class MockModel(BaseModel):
+    # Result of validate_config, and a factory for the error initialize raises
+    valid_config = True
+    init_error = None
+    
     def __init__(self):
         self.initialized = False
         self.config = None
         
     def initialize(self, config: BaseConfig) -> None:
+        if self.init_error is not None:
+            raise self.init_error()
         self.initialized = True
         self.config = config
         
@@ -73,70 +80,71 @@ class MockModel(BaseModel):
         return {"result": "mock_result"}
         
     def validate_config(self, config: BaseConfig) -> bool:
-        return True
+        return self.valid_config
 
 
-# Mock model with validation failure
-class MockInvalidModel(BaseModel):
-    def initialize(self, config: BaseConfig) -> None:
-        pass
-        
-    def process_image(self, image_path):
-        return {}
-        
-    def validate_config(self, config: BaseConfig) -> bool:
-        return False
+def _make_model(name: str, **behavior: Any) -> Type[MockModel]:
+    """Create a MockModel variant with the given class attributes."""
+    return type(name, (MockModel,), behavior)
 
 
-# Mock model with initialization error
-class MockErrorModel(BaseModel):
-    def initialize(self, config: BaseConfig) -> None:
-        raise ModelInitializationError("Initialization failed")
-        
-    def process_image(self, image_path):
-        return {}
-        
-    def validate_config(self, config: BaseConfig) -> bool:
-        return True
+# Mock model with validation failure
+MockInvalidModel = _make_model("MockInvalidModel", valid_config=False)
 
+# Mock model with initialization error
+MockErrorModel = _make_model(
+    "MockErrorModel",
+    init_error=partial(ModelInitializationError, "Initialization failed")
+)
 
 # Mock model with resource error
-class MockResourceErrorModel(BaseModel):
-    def initialize(self, config: BaseConfig) -> None:
-        raise ModelResourceError("Resource not available")
-        
-    def process_image(self, image_path):
-        return {}
-        
-    def validate_config(self, config: BaseConfig) -> bool:
-        return True
+MockResourceErrorModel = _make_model(
+    "MockResourceErrorModel",
+    init_error=partial(ModelResourceError, "Resource not available")
+)
+
+
+# Model configuration returned by the mock config manager by default
+_DEFAULT_MODEL_CONFIG = {
+    "model": {
+        "name": "test_model",
+        "type": "mock_model",
+        "version": "1.0",
+        "parameters": {}
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def shared_config_manager():
+    """Create the mock configuration manager once."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def baseline_model_types():
+    """Model types registered before any factory test runs."""
+    return frozenset(ModelFactory.MODEL_REGISTRY)
 
 
 class TestModelFactory:
     """Test the ModelFactory class and its error handling."""
     
     @pytest.fixture
-    def config_manager(self):
-        """Create a mock configuration manager."""
-        manager = MagicMock()
-        mock_config = MagicMock(spec=ModelConfig)
-        # Set up necessary methods that will be called
-        mock_config.get_value.side_effect = lambda key, default=None: {
-            "name": "test_model",
-            "type": "mock_model",
-            "version": "1.0"
-        }.get(key, default)
-        mock_config.validate.return_value = True
-        manager.get_config.return_value = mock_config
+    def config_manager(self, shared_config_manager):
+        """Provide the shared mock configuration manager in its default state."""
+        manager = shared_config_manager
+        manager.reset_mock()
+        # Tests may swap the returned config, so restore the default each time
+        manager.get_config.return_value = ModelConfig(_DEFAULT_MODEL_CONFIG)
         return manager
     
     @pytest.fixture
-    def clean_registry(self):
-        """Clear and restore model registry between tests."""
-        original_registry = ModelFactory.MODEL_REGISTRY.copy()
-        ModelFactory.MODEL_REGISTRY = {}
+    def clean_registry(self, baseline_model_types):
+        """Unregister the model types a test registered once it finishes."""
         yield
-        ModelFactory.MODEL_REGISTRY = original_registry
+        for model_type in ModelFactory.MODEL_REGISTRY.keys() - baseline_model_types:
+            del ModelFactory.MODEL_REGISTRY[model_type]
     
     def test_register_model(self, clean_registry):
         """Test model registration."""
@@ -154,13 +162,10 @@ class TestModelFactory:
         with pytest.raises(ValueError):
             ModelFactory.register_model("invalid_model", str)  # Not a BaseModel
     
-    def test_create_model(self, clean_registry, config_manager):
+    def test_create_model(self, config_manager):
         """Test model creation and initialization."""
-        # Register model
-        ModelFactory.register_model("mock_model", MockModel)
-        
         # Create factory with mock config manager
-        factory = ModelFactory(config_manager)
+        factory = ModelFactory(config_manager, registry={"mock_model": MockModel})
         
         # Create model
         model = factory.create_model("test_model")
@@ -171,14 +176,21 @@ class TestModelFactory:
         assert model.config.get_value("name") == "test_model"
         assert model.config.get_value("type") == "mock_model"
     
-    def test_create_model_with_explicit_config(self, clean_registry):
-        """Test model creation with explicit configuration."""
-        # Register model
+    def test_create_model_uses_registered_models(self, clean_registry, config_manager):
+        """Test that factories default to the shared model registry."""
         ModelFactory.register_model("mock_model", MockModel)
+        factory = ModelFactory(config_manager)
         
+        model = factory.create_model("test_model")
+        
+        assert isinstance(model, MockModel)
+        assert model.initialized
+    
+    def test_create_model_with_explicit_config(self):
+        """Test model creation with explicit configuration."""
         # Create factory with mock config manager
         mock_config_manager = MagicMock()
-        factory = ModelFactory(mock_config_manager)
+        factory = ModelFactory(mock_config_manager, registry={"mock_model": MockModel})
         
         # Create explicit config
         config = MockConfig({
@@ -197,18 +209,15 @@ class TestModelFactory:
         assert model.config.get_value("name") == "explicit_model"
         assert model.config.get_value("custom_param") == "value"
     
-    def test_factory_requires_config_manager(self, clean_registry):
+    def test_factory_requires_config_manager(self):
         """Test that factory requires config_manager."""
         with pytest.raises(ValueError, match="config_manager is required"):
             ModelFactory(None)
     
-    def test_create_model_validation_failure(self, clean_registry, config_manager):
+    def test_create_model_validation_failure(self, config_manager):
         """Test error handling for validation failure."""
-        # Register invalid model
-        ModelFactory.register_model("mock_model", MockInvalidModel)
-        
         # Create factory
-        factory = ModelFactory(config_manager)
+        factory = ModelFactory(config_manager, registry={"mock_model": MockInvalidModel})
         
         # Attempt to create model
         with pytest.raises(ModelConfigError) as excinfo:
@@ -216,10 +225,10 @@ class TestModelFactory:
             
         assert "Configuration validation failed" in str(excinfo.value)
     
-    def test_create_model_unknown_type(self, clean_registry, config_manager):
+    def test_create_model_unknown_type(self, config_manager):
         """Test error handling for unknown model type."""
         # Create factory without registering any models
-        factory = ModelFactory(config_manager)
+        factory = ModelFactory(config_manager, registry={})
         
         # Attempt to create model with unknown type
         with pytest.raises(ModelCreationError) as excinfo:
@@ -227,16 +236,13 @@ class TestModelFactory:
             
         assert "Unsupported model type" in str(excinfo.value)
     
-    def test_create_model_invalid_config(self, clean_registry, config_manager):
+    def test_create_model_invalid_config(self, config_manager):
         """Test error handling for invalid configuration."""
-        # Register model
-        ModelFactory.register_model("mock_model", MockModel)
-        
         # Make the config manager return invalid config type
         config_manager.get_config.return_value = "not a config"
         
         # Create factory
-        factory = ModelFactory(config_manager)
+        factory = ModelFactory(config_manager, registry={"mock_model": MockModel})
         
         # Attempt to create model
         with pytest.raises(ModelConfigError) as excinfo:
@@ -244,18 +250,15 @@ class TestModelFactory:
             
         assert "Invalid configuration type" in str(excinfo.value)
     
-    def test_create_model_missing_type(self, clean_registry, config_manager):
+    def test_create_model_missing_type(self, config_manager):
         """Test error handling for missing model type."""
-        # Register model
-        ModelFactory.register_model("mock_model", MockModel)
-        
-        # Make the config return None for the type
-        mock_config = MagicMock(spec=ModelConfig)
-        mock_config.get_value.side_effect = lambda key, default=None: None if key == "type" else "test_value"
-        config_manager.get_config.return_value = mock_config
+        # Return a config without a model type
+        config_manager.get_config.return_value = ModelConfig({
+            "model": {"name": "test_model", "version": "1.0", "parameters": {}}
+        })
         
         # Create factory
-        factory = ModelFactory(config_manager)
+        factory = ModelFactory(config_manager, registry={"mock_model": MockModel})
         
         # Attempt to create model
         with pytest.raises(ModelConfigError) as excinfo:
@@ -263,13 +266,10 @@ class TestModelFactory:
             
         assert "Model type not specified" in str(excinfo.value)
     
-    def test_create_model_initialization_error(self, clean_registry, config_manager):
+    def test_create_model_initialization_error(self, config_manager):
         """Test error handling for initialization error."""
-        # Register error model
-        ModelFactory.register_model("mock_model", MockErrorModel)
-        
         # Create factory
-        factory = ModelFactory(config_manager)
+        factory = ModelFactory(config_manager, registry={"mock_model": MockErrorModel})
         
         # Attempt to create model
         with pytest.raises(ModelInitializationError) as excinfo:
@@ -277,13 +277,10 @@ class TestModelFactory:
             
         assert "Initialization failed" in str(excinfo.value)
     
-    def test_create_model_resource_error(self, clean_registry, config_manager):
+    def test_create_model_resource_error(self, config_manager):
         """Test error handling for resource error."""
-        # Register resource error model
-        ModelFactory.register_model("mock_model", MockResourceErrorModel)
-        
         # Create factory
-        factory = ModelFactory(config_manager)
+        factory = ModelFactory(config_manager, registry={"mock_model": MockResourceErrorModel})
         
         # Attempt to create model
         with pytest.raises(ModelResourceError) as excinfo:
@@ -291,9 +288,9 @@ class TestModelFactory:
             
         assert "Resource not available" in str(excinfo.value)
     
-    def test_create_model_unexpected_error(self, clean_registry, config_manager):
+    def test_create_model_unexpected_error(self, config_manager):
         """Test error handling for unexpected errors."""
-        # Register model class that raises unexpected error
+        # Model class that raises unexpected error
         class BrokenModel(BaseModel):
             def __init__(self):
                 raise RuntimeError("Unexpected initialization error")
@@ -307,14 +304,13 @@ class TestModelFactory:
             def validate_config(self, config):
                 return True
                 
-        ModelFactory.register_model("mock_model", BrokenModel)
-        
         # Create factory
-        factory = ModelFactory(config_manager)
+        factory = ModelFactory(config_manager, registry={"mock_model": BrokenModel})
         
         # Attempt to create model
         with pytest.raises(ModelCreationError) as excinfo:
             factory.create_model("test_model")
             
-        assert "Failed to instantiate model class" in str(excinfo.value)
-        assert "Unexpected initialization error" in str(excinfo.value) 
\ No newline at end of file
+        message = str(excinfo.value)
+        assert "Failed to instantiate model class" in message
+        assert "Unexpected initialization error" in message 
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""Tests for the prompt caching helpers."""
+
+import weakref
+from collections import defaultdict
+
+import pytest
+
+from src.prompts.base_prompt_generator import BasePromptGenerator
+from src.prompts.prompt_cache import make_cache_key
+
+
+class CountingGenerator(BasePromptGenerator):
+    """Minimal generator that counts uncached renders."""
+
+    __slots__ = ("renders", "__weakref__")
+
+    def __init__(self):
+        super().__init__()
+        self.renders = 0
+
+    def _render(self, data):
+        self.renders += 1
+        return "Extract {field}".format_map(data)
+
+    def generate_prompt(self, context):
+        return self._generate_cached(context, self._render)
+
+    def initialize(self, config):
+        pass
+
+    def validate_config(self, config):
+        return True
+
+    def get_template(self, template_name):
+        return None
+
+    def get_templates_for_field(self, field_type):
+        return []
+
+    def cleanup(self):
+        pass
+
+
+def test_cache_key_accepts_scalar_data():
+    """Test that data made of plain scalars produces a key."""
+    data = {"field": "total", "invoice_id": 1017, "threshold": 0.5, "strict": False}
+
+    assert make_cache_key(data) is not None
+
+
+def test_cache_key_ignores_insertion_order():
+    """Test that equal data produces equal keys regardless of key order."""
+    assert make_cache_key({"a": "x", "b": 2}) == make_cache_key({"b": 2, "a": "x"})
+
+
+def test_cache_key_distinguishes_equal_values_of_different_types():
+    """Test that values comparing equal but rendering differently get distinct keys."""
+    assert make_cache_key({"flag": 1}) != make_cache_key({"flag": True})
+
+
+@pytest.mark.parametrize("data", [
+    {"items": ["a", "b"]},
+    {"nested": {"a": 1}},
+    {"missing": None},
+    {1: "non-string key"},
+    defaultdict(str, {"field": "total"}),
+])
+def test_cache_key_rejects_unhashable_data(data):
+    """Test that data with non-scalar values or keys is not cached."""
+    assert make_cache_key(data) is None
+
+
+def test_generator_cache_is_per_instance():
+    """Test that rendered prompts are memoized per generator instance."""
+    first, second = CountingGenerator(), CountingGenerator()
+
+    assert first.generate_prompt({"field": "total"}) == "Extract total"
+    assert first.generate_prompt({"field": "total"}) == "Extract total"
+    second.generate_prompt({"field": "total"})
+
+    assert (first.renders, second.renders) == (1, 1)
+
+
+def test_generator_cache_skips_unhashable_data():
+    """Test that data that cannot form a cache key is rendered every time."""
+    generator = CountingGenerator()
+    generator.generate_prompt({"field": "total", "items": ["a"]})
+    generator.generate_prompt({"field": "total", "items": ["a"]})
+
+    assert generator.renders == 2
+
+
+def test_generator_cache_does_not_keep_generator_alive():
+    """Test that a generator with cached prompts is freed without the cyclic GC."""
+    generator = CountingGenerator()
+    generator.generate_prompt({"field": "total"})
+    ref = weakref.ref(generator)
+
+    del generator
+    assert ref() is None
+
+
+def test_generator_renders_dict_subclasses_uncached():
+    """Test that missing keys resolve through the caller's mapping every time."""
+    generator = CountingGenerator()
+    data = defaultdict(lambda: "unknown")
+
+    assert generator.generate_prompt(data) == "Extract unknown"
+    assert generator.generate_prompt(data) == "Extract unknown"
+    assert generator.renders == 2
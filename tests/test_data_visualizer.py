@@ -93,6 +93,23 @@ class TestDataVisualizer:
         assert isinstance(fig, plt.Figure)
         plt.close(fig)
 
+    def test_missing_value_labels_follow_bar_order(self, visualizer):
+        """Test that percentage labels line up with the sorted bars."""
+        df = pd.DataFrame({
+            'a': [1, None, 3, None],
+            'b': [None, 2.0, 3.0, 4.0],
+            'c': ['x', None, None, None]
+        })
+        fig = visualizer.plot_missing_values(df)
+        ax = fig.axes[0]
+
+        bar_labels = [label.get_text() for label in ax.get_yticklabels()]
+        value_labels = [text.get_text() for text in ax.texts]
+        assert bar_labels == ['b', 'a', 'c']
+        assert value_labels == ['25.0% (1)', '50.0% (2)', '75.0% (3)']
+
+        plt.close(fig)
+
     def test_plot_distributions(self, visualizer, sample_dataframe):
         """Test plotting distributions."""
         # Test all numeric columns
@@ -149,4 +166,76 @@ class TestDataVisualizer:
         for fmt in visualizer.output_formats:
             assert any(str(f).endswith(f'.{fmt}') for f in saved_files)
             
-        plt.close(fig) 
\ No newline at end of file
+        plt.close(fig)
+
+    def test_numeric_columns_cache(self, visualizer, sample_dataframe):
+        """Test that numeric columns are cached per frame and refreshed on column or dtype changes."""
+        first = visualizer._numeric_cols(sample_dataframe)
+        assert first == ['numeric_col1', 'numeric_col2']
+        assert visualizer._numeric_cols(sample_dataframe) is first
+
+        sample_dataframe['numeric_col3'] = range(len(sample_dataframe))
+        assert visualizer._numeric_cols(sample_dataframe) == [
+            'numeric_col1', 'numeric_col2', 'numeric_col3'
+        ]
+
+        sample_dataframe['numeric_col1'] = sample_dataframe['numeric_col1'].astype(str)
+        assert visualizer._numeric_cols(sample_dataframe) == ['numeric_col2', 'numeric_col3']
+
+    def test_fortran_block_skips_mixed_frames_without_converting(self, sample_dataframe, monkeypatch):
+        """Test that multi-block frames are returned as-is without building an array."""
+        from src.visualization import data_visualizer
+
+        def fail(*args, **kwargs):
+            raise AssertionError("to_numpy should not be called")
+
+        monkeypatch.setattr(pd.DataFrame, 'to_numpy', fail)
+        assert data_visualizer._to_fortran_block(sample_dataframe) is sample_dataframe
+
+    def test_plot_figures_are_independent(self, visualizer, sample_dataframe):
+        """Test that repeated plots return separate figures the caller owns."""
+        first = visualizer.plot_dtypes(sample_dataframe)
+        second = visualizer.plot_dtypes(sample_dataframe)
+
+        assert second is not first
+        assert plt.fignum_exists(first.number)
+        assert "Data Types" in first.axes[0].get_title()
+        plt.close(first)
+        plt.close(second)
+
+    def test_wide_correlation_annotates_strongest_cells(self, visualizer):
+        """Test that wide correlation heatmaps only annotate their strongest cells."""
+        import numpy as np
+        from src.visualization import data_visualizer
+
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=(200, 30))
+        values[:, 1] = values[:, 0]
+        df = pd.DataFrame(values, columns=[f'c{i}' for i in range(30)])
+
+        fig = visualizer.plot_correlations(df)
+        texts = [text.get_text() for text in fig.axes[0].texts]
+        assert len(texts) == data_visualizer._TOP_K_ANNOTATIONS
+        assert '1.00' in texts
+
+        plt.close(fig)
+
+    def test_pearson_corr_matches_pandas(self, visualizer):
+        """Test that the matrix-product Pearson correlation matches pandas in double precision."""
+        import numpy as np
+
+        rng = np.random.default_rng(1)
+        values = rng.normal(loc=1e4, size=(500, 6))
+        df = pd.DataFrame(values, columns=[f'c{i}' for i in range(6)])
+
+        corr = visualizer._pearson_corr(df)
+        assert corr.to_numpy().dtype == np.float64
+        np.testing.assert_allclose(corr.to_numpy(), df.corr().to_numpy(), atol=1e-10)
+
+    def test_batch_visualize_returns_png_bytes(self, visualizer, sample_dataframe):
+        """Test that batch visualization renders each frame to PNG in worker processes."""
+        frames = [sample_dataframe, sample_dataframe.iloc[:5]]
+        images = visualizer.batch_visualize(frames, max_workers=2)
+
+        assert len(images) == len(frames)
+        assert all(image.startswith(b'\x89PNG') for image in images)
@@ -0,0 +1,60 @@
+import pytest
+import matplotlib
+# Set non-interactive backend for testing
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from PIL import Image
+
+from src.visualization.image_visualizer import ImageVisualizer
+
+
+class TestImageVisualizer:
+    """Test suite for the ImageVisualizer class."""
+
+    @pytest.fixture
+    def visualizer(self):
+        """Create an ImageVisualizer instance."""
+        return ImageVisualizer(fig_size=(8, 6), dpi=100)
+
+    @pytest.fixture
+    def sample_image(self):
+        """Create a blank invoice-sized image."""
+        return Image.new('RGB', (200, 300), color='white')
+
+    def test_extracted_fields_stack_upward_in_field_order(self, visualizer, sample_image):
+        """Test that the first extracted field is the bottom line of the text block."""
+        extracted_fields = {
+            'invoice_number': 'INV-001',
+            'date': '2023-01-01',
+            'total': '42.00'
+        }
+        fig = visualizer.visualize_with_extracted_fields(sample_image, extracted_fields)
+        lines = fig.axes[0].texts[0].get_text().split('\n')
+
+        assert lines == ['total: 42.00', 'date: 2023-01-01', 'invoice_number: INV-001']
+        plt.close(fig)
+
+    def test_visualize_image_reports_full_size_of_draft_decoded_jpeg(self, visualizer, tmp_path):
+        """Test that a JPEG decoded at reduced size is labelled with its full size."""
+        path = tmp_path / 'large_invoice.jpg'
+        Image.new('RGB', (3000, 4000), color='white').save(path, format='JPEG')
+
+        fig = visualizer.visualize_image(path)
+        labels = [text.get_text() for text in fig.axes[0].texts]
+
+        assert any(label.startswith('Size: 3000x4000') for label in labels)
+        plt.close(fig)
+
+    def test_rasterize_annotations_draws_boxes_and_point_lists(self, visualizer):
+        """Test that boxes and point lists are drawn and unknown entries skipped."""
+        img = Image.new('RGB', (200, 200), color='white')
+        annotations = {
+            'total': (10, 60, 50, 50),
+            'vendor': [(100, 100), (150, 150)],
+            'notes': 'not an annotation'
+        }
+        canvas = visualizer._rasterize_annotations(img, annotations)
+
+        assert canvas.getpixel((10, 90)) == (255, 0, 0)
+        assert canvas.getpixel((125, 125)) == (255, 0, 0)
+        assert img.getpixel((10, 90)) == (255, 255, 255)
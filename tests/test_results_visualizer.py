@@ -0,0 +1,142 @@
+import pytest
+import numpy as np
+import matplotlib
+# Set non-interactive backend for testing
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from src.visualization.results_visualizer import (
+    ResultsTable,
+    ResultsVisualizer,
+    field_result_arrays
+)
+
+
+class TestResultsVisualizer:
+    """Test suite for the ResultsVisualizer class."""
+
+    @pytest.fixture
+    def visualizer(self):
+        """Create a ResultsVisualizer instance."""
+        return ResultsVisualizer(fig_size=(8, 6), dpi=100)
+
+    @pytest.fixture
+    def model_results(self):
+        """Create sample per-model summary results."""
+        return {
+            'pixtral': {'normalized_match_rate': 0.82, 'exact_match_rate': 0.7},
+            'llama_vision': {'normalized_match_rate': 0.64, 'exact_match_rate': 0.5},
+            'doctr': {'normalized_match_rate': 0.91, 'exact_match_rate': 0.88}
+        }
+
+    def test_model_comparison_returns_new_figures(self, visualizer, model_results):
+        """Test that identical calls return separate figures the caller owns."""
+        first = visualizer.visualize_model_comparison(model_results)
+        second = visualizer.visualize_model_comparison(model_results)
+
+        assert second is not first
+        plt.close(first)
+        assert second.axes[0].patches
+        plt.close(second)
+
+    def test_field_results_accept_dicts_and_arrays(self, visualizer):
+        """Test that field results render the same from dicts and precomputed arrays."""
+        field_results = {
+            'invoice_number': {'normalized_match': True},
+            'total': {'normalized_match': False},
+            'vendor': {'missing_in_extracted': True},
+            'date': {'missing_in_ground_truth': True, 'normalized_match': True}
+        }
+        from_dicts = visualizer.visualize_field_results(field_results)
+        from_arrays = visualizer.visualize_field_results(field_result_arrays(field_results))
+
+        for fig in (from_dicts, from_arrays):
+            labels = [label.get_text() for label in fig.axes[0].get_yticklabels()]
+            assert labels == ['total', 'invoice_number']
+        plt.close('all')
+
+    def test_field_results_without_scored_fields_return_placeholder(self, visualizer):
+        """Test that results with no comparable fields return a fresh placeholder figure."""
+        all_missing = {'total': {'missing_in_extracted': True}}
+        fig = visualizer.visualize_field_results(all_missing)
+        other = visualizer.visualize_field_results({})
+        
+        assert other is not fig
+        assert fig.axes[0].texts[0].get_text() == "No field results to display"
+        plt.close(fig)
+        plt.close(other)
+        
+    def test_model_prompt_heatmap_fills_missing_combinations(self, visualizer):
+        """Test that the heatmap lays out models by prompts with missing cells as zero."""
+        results_matrix = {
+            'pixtral': {'detailed': 0.9, 'basic': 0.7},
+            'doctr': {'basic': 0.5}
+        }
+        fig = visualizer.visualize_model_prompt_heatmap(results_matrix)
+        ax = fig.axes[0]
+
+        assert [label.get_text() for label in ax.get_xticklabels()] == ['basic', 'detailed']
+        assert [label.get_text() for label in ax.get_yticklabels()] == ['pixtral', 'doctr']
+        assert [text.get_text() for text in ax.texts] == ['0.70', '0.90', '0.50', '0.00']
+        plt.close(fig)
+
+    def test_model_prompt_heatmap_scales_colors_to_data(self, visualizer):
+        """Test that the heatmap color range follows the values rather than [0, 1]."""
+        results_matrix = {
+            'pixtral': {'basic': 12.0, 'detailed': 30.0},
+            'doctr': {'basic': 4.0, 'detailed': 8.0}
+        }
+        fig = visualizer.visualize_model_prompt_heatmap(results_matrix, metric="avg_cer")
+        norm = fig.axes[0].images[0].norm
+
+        assert (norm.vmin, norm.vmax) == (4.0, 30.0)
+        plt.close(fig)
+
+    def test_results_table_keeps_numpy_metrics(self):
+        """Test that NumPy scalar metrics are kept rather than treated as missing."""
+        table = ResultsTable.from_dict({
+            'a': {'score': np.float32(0.9)},
+            'b': {'score': np.int64(1)},
+            'c': {'score': 0.5}
+        })
+
+        np.testing.assert_allclose(table.column('score'), [0.9, 1.0, 0.5], rtol=1e-6)
+
+    def test_results_table_from_dict(self, model_results):
+        """Test building a dense results table from nested result dictionaries."""
+        model_results['doctr']['missing_in_extracted'] = ['vendor']
+        table = ResultsTable.from_dict(model_results)
+
+        assert table.models.tolist() == ['pixtral', 'llama_vision', 'doctr']
+        assert table.metric_names.tolist() == ['normalized_match_rate', 'exact_match_rate']
+        assert table.values.dtype == np.float32
+        np.testing.assert_allclose(table.column('exact_match_rate'), [0.7, 0.5, 0.88], rtol=1e-6)
+        assert table.column('unknown_metric').tolist() == [0.0, 0.0, 0.0]
+
+    def test_results_table_sorted_by(self, model_results):
+        """Test that models are ordered by descending metric value."""
+        table = ResultsTable.from_dict(model_results)
+        models, values = table.sorted_by('normalized_match_rate')
+
+        assert models.tolist() == ['doctr', 'pixtral', 'llama_vision']
+        assert np.all(np.diff(values) <= 0)
+        assert table.sorted_by('normalized_match_rate')[0].tolist() == models.tolist()
+
+    def test_model_comparison_accepts_results_table(self, visualizer, model_results):
+        """Test that a ResultsTable renders bars sorted by the chosen metric."""
+        fig = visualizer.visualize_model_comparison(ResultsTable.from_dict(model_results))
+        labels = [label.get_text() for label in fig.axes[0].get_xticklabels()]
+
+        assert labels == ['doctr', 'pixtral', 'llama_vision']
+        plt.close(fig)
+
+    def test_package_import_does_not_load_seaborn(self):
+        """Test that seaborn is only imported when a plot needs it."""
+        import subprocess
+        import sys
+
+        code = "import sys, src.visualization; print('seaborn' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
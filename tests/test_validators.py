@@ -116,6 +116,30 @@ class TestExtractedDataValidator:
         assert field_results["Total"]["normalized"] is None
         assert field_results["Work Order Number"]["valid"] is False
         
+    def test_short_circuit_stops_at_first_failure(self, invalid_extracted_data):
+        """Test that short-circuit mode skips validators after the first failure."""
+        calls = []
+        
+        def failing_validator(value):
+            calls.append(value)
+            return False, "bad value", None
+            
+        validator = ExtractedDataValidator(short_circuit=True)
+        validator.field_validators = {
+            "Total": failing_validator,
+            "Work Order Number": failing_validator
+        }
+        
+        assert validator.validate(invalid_extracted_data) is False
+        assert len(calls) == 1
+        assert len(validator.get_errors()) == 1
+        
+        # Without short-circuiting every field is checked
+        validator.short_circuit = False
+        validator.validate(invalid_extracted_data)
+        assert len(calls) == 3
+        assert len(validator.get_errors()) == 2
+        
     def test_validate_empty_data(self, validator):
         """Test validation with empty data."""
         result = validator.validate({})
@@ -0,0 +1,59 @@
+import pytest
+import pandas as pd
+import matplotlib
+# Set non-interactive backend for testing
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from PIL import Image
+
+from src.visualization.visualization_service import VisualizationService
+
+
+class TestVisualizationService:
+    """Test suite for the VisualizationService class."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create a VisualizationService writing to a temporary directory."""
+        return VisualizationService(output_dir=tmp_path)
+
+    @pytest.fixture
+    def dashboard_inputs(self):
+        """Create the inputs for a summary dashboard."""
+        return {
+            'ground_truth_data': pd.DataFrame({'total': [1.0, None, 3.0], 'vendor': ['a', 'b', None]}),
+            'model_results': {
+                'pixtral': {'normalized_match_rate': 0.82},
+                'doctr': {'normalized_match_rate': 0.91}
+            },
+            'sample_image': Image.new('RGB', (200, 300), color='white'),
+            'sample_extraction': {'invoice_number': 'INV-001', 'total': '42.00'}
+        }
+
+    def test_dashboard_stacks_fields_upward_in_field_order(self, service, dashboard_inputs):
+        """Test that the dashboard lists extracted fields in the same order as ImageVisualizer."""
+        service.generate_summary_dashboard(**dashboard_inputs, formats=['png'], reuse=True)
+        fig, panels = service._dashboard_cache
+        texts = [text.get_text() for text in panels['sample_ax'].texts]
+
+        assert texts == ['total: 42.00\ninvoice_number: INV-001']
+        plt.close(fig)
+
+    def test_close_releases_reused_dashboard(self, service, dashboard_inputs):
+        """Test that close() unregisters the dashboard figure kept for reuse."""
+        service.generate_summary_dashboard(**dashboard_inputs, formats=['png'], reuse=True)
+        fig, _ = service._dashboard_cache
+        assert plt.fignum_exists(fig.number)
+
+        service.close()
+        assert not plt.fignum_exists(fig.number)
+        assert service._dashboard_cache is None
+        service.close()
+
+    def test_context_manager_closes_reused_dashboard(self, tmp_path, dashboard_inputs):
+        """Test that leaving the service's with block closes the kept dashboard."""
+        with VisualizationService(output_dir=tmp_path) as service:
+            service.generate_summary_dashboard(**dashboard_inputs, formats=['png'], reuse=True)
+            fig, _ = service._dashboard_cache
+
+        assert not plt.fignum_exists(fig.number)
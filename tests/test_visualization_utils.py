@@ -67,12 +67,15 @@ class TestVisualizationUtils:
             'field3': [(150, 50), (170, 60), (160, 80)]  # polygon points
         }
 
-    def test_configure_matplotlib_defaults(self):
+    def test_configure_matplotlib_defaults(self, monkeypatch):
         """Test configuration of matplotlib defaults."""
+        from src.visualization import visualization_utils
+
         # Save original rcParams
         original_rcParams = plt.rcParams.copy()
         
-        # Configure defaults
+        # Configure defaults, even if an earlier test already applied them
+        monkeypatch.setattr(visualization_utils, '_DEFAULTS_APPLIED', False)
         configure_matplotlib_defaults()
         
         # Check that rcParams were updated
@@ -81,6 +84,11 @@ class TestVisualizationUtils:
         assert plt.rcParams['axes.labelsize'] == 12
         assert plt.rcParams['axes.titlesize'] == 14
         
+        # Later calls leave rcParams alone
+        plt.rcParams['axes.labelsize'] = 20
+        configure_matplotlib_defaults()
+        assert plt.rcParams['axes.labelsize'] == 20
+        
         # Restore original rcParams
         plt.rcParams.update(original_rcParams)
 
@@ -127,6 +135,31 @@ class TestVisualizationUtils:
         
         plt.close(fig)
 
+    def test_save_figure_without_pyplot_canvas(self, temp_output_dir):
+        """Test saving a bare Figure that has no renderer-backed canvas."""
+        from matplotlib.figure import Figure
+
+        fig = Figure()
+        fig.add_subplot().plot([1, 2, 3], [4, 5, 6])
+
+        filename = os.path.join(temp_output_dir, 'bare_figure')
+        saved_files = save_figure(fig, filename)
+
+        assert len(saved_files) == 2
+        assert all(os.path.exists(f) for f in saved_files)
+
+    def test_save_figure_with_layout_padding(self, temp_output_dir):
+        """Test that pad_inches='layout' is passed through to savefig."""
+        fig, ax = plt.subplots(layout='constrained')
+        ax.plot([1, 2, 3], [4, 5, 6])
+
+        filename = os.path.join(temp_output_dir, 'layout_padded')
+        saved_files = save_figure(fig, filename, formats=['png'], pad_inches='layout')
+
+        assert len(saved_files) == 1
+        assert os.path.exists(saved_files[0])
+        plt.close(fig)
+
     def test_plot_confusion_matrix(self, test_confusion_matrix):
         """Test confusion matrix plotting."""
         # Test with default parameters
@@ -194,6 +227,16 @@ class TestVisualizationUtils:
         
         plt.close(fig)
 
+    def test_plot_confusion_matrix_without_class_names(self, test_confusion_matrix):
+        """Test that classes are numbered when no class names are given."""
+        fig = plot_confusion_matrix(test_confusion_matrix)
+        
+        ax = fig.axes[0]
+        n_classes = test_confusion_matrix.shape[0]
+        assert [t.get_text() for t in ax.get_xticklabels()] == [str(i) for i in range(n_classes)]
+        
+        plt.close(fig)
+
     def test_plot_image_with_annotations(self, test_image, test_annotations):
         """Test image annotation plotting."""
         # Test with PIL Image
@@ -204,12 +247,13 @@ class TestVisualizationUtils:
         assert ax.get_title() == 'Annotated Image'
         
         # Check that annotations were added
-        patches_list = [p for p in ax.patches if hasattr(p, 'get_width')]
-        assert len(patches_list) == 2  # Two box annotations
+        assert len(ax.collections) == 1
+        assert len(ax.collections[0].get_paths()) == 2  # Two box annotations
         
         # Check for line plots (polygon)
         lines = [line for line in ax.get_lines() if len(line.get_xdata()) > 0]
         assert len(lines) == 1  # One polygon
+        assert [text.get_text() for text in ax.texts] == ['field1', 'field2', 'field3']
         
         plt.close(fig)
         